@@ -1,13 +1,22 @@
 import os
 import asyncio
 import discord
-import requests
+import aiohttp
 import logging
 import json
 import hashlib
+import heapq
+import bisect
+import math
 import subprocess
 import random
+import sqlite3
 import string
+import time
+from array import array
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 from discord.ext import tasks, commands
 from dotenv import load_dotenv
 from discord import app_commands
@@ -21,26 +30,357 @@ def log_error(e):
 # Load environment variables
 load_dotenv()
 TOKEN = os.getenv("DISCORD_TOKEN")
-SERVER_USER_IDS_FILE = "server_user_ids.json"  # File to store server-specific user IDs
+SERVER_USER_IDS_FILE = "server_user_ids.json"  # Legacy file with server-specific user IDs, imported once
+DATABASE_FILE = "soul.db"  # SQLite database holding the bot's persistent state
 
-ROBLOX_COOKIES = [
-    os.getenv("ROBLOX_COOKIE_1"),
-    os.getenv("ROBLOX_COOKIE_2"),
-    os.getenv("ROBLOX_COOKIE_3")
-]
+ROBLOX_COOKIE_VARIABLES = ["ROBLOX_COOKIE_1", "ROBLOX_COOKIE_2", "ROBLOX_COOKIE_3"]
+ROBLOX_COOKIES = {name: os.getenv(name) for name in ROBLOX_COOKIE_VARIABLES if os.getenv(name)}
 
-cookie_index = 0  # Global index to track the current cookie
+COOKIE_VALIDATION_URL = "https://users.roblox.com/v1/users/authenticated"
+COOKIE_QUARANTINE_BASE = 30  # seconds a cookie sits out after its first bad response
+COOKIE_QUARANTINE_MAX = 30 * 60  # seconds; repeated bad responses back off up to this
 
-def get_next_cookie():
-    global cookie_index
-    cookie = ROBLOX_COOKIES[cookie_index]
-    cookie_index = (cookie_index + 1) % len(ROBLOX_COOKIES)  # Move to the next cookie
-    return cookie
+class CookieHealth:
+    """
+    Health statistics for one .ROBLOSECURITY cookie.
+    """
+    def __init__(self, name: str, cookie: str):
+        self.name = name  # Environment variable the cookie came from; never log the cookie itself
+        self.cookie = cookie
+        self.successes = 0
+        self.unauthorized = 0  # 401 responses: expired or revoked cookie
+        self.throttled = 0  # 429 responses
+        self.failures = 0  # Other errors
+        self.remaining = None  # Requests left in the current rate limit window, if Roblox reported it
+        self.strikes = 0  # Consecutive bad responses, drives the quarantine backoff
+        self.quarantined_until = 0.0
+        self.in_flight = 0
+
+    def is_available(self, now: float) -> bool:
+        return now >= self.quarantined_until
+
+    def score(self) -> float:
+        # Smoothed success rate, plus a bonus for reported budget, minus a penalty for requests already in flight
+        total = self.successes + self.unauthorized + self.throttled + self.failures
+        score = (self.successes + 1) / (total + 2)
+        if self.remaining is not None:
+            score += min(self.remaining, 100) / 100
+        else:
+            score += 0.5
+        return score - 0.1 * self.in_flight
+
+    def stats(self) -> dict:
+        return {
+            "successes": self.successes,
+            "unauthorized": self.unauthorized,
+            "throttled": self.throttled,
+            "failures": self.failures,
+            "remaining": self.remaining,
+            "quarantined_for": max(0, round(self.quarantined_until - time.monotonic()))
+        }
+
+class CookiePool:
+    """
+    Routes authenticated requests to the healthiest .ROBLOSECURITY cookie.
+    Cookies that return 401 or 429 are quarantined with exponential backoff; when every cookie
+    is quarantined, requests go out unauthenticated instead of using a known-bad cookie.
+    """
+    def __init__(self, cookies: dict):
+        self.entries = [CookieHealth(name, cookie) for name, cookie in cookies.items()]
+
+    def acquire(self):
+        now = time.monotonic()
+        available = [entry for entry in self.entries if entry.is_available(now)]
+        if not available:
+            return None
+        entry = max(available, key=lambda candidate: candidate.score())
+        entry.in_flight += 1
+        return entry
+
+    def release(self, entry: CookieHealth, status=None, headers=None, cancelled=False):
+        """
+        Record the outcome of a request made with a cookie. A status of None means the request never got a response.
+        A request we cancelled ourselves before it got one says nothing about the cookie and is not counted.
+        """
+        entry.in_flight = max(0, entry.in_flight - 1)
+        if cancelled and status is None:
+            return
+        headers = headers or {}
+
+        remaining = parse_header_number(headers.get("x-ratelimit-remaining"))
+        if remaining is not None:
+            entry.remaining = remaining
+
+        if status is None or (status >= 400 and status not in (401, 429)):
+            entry.failures += 1
+        elif status == 401:
+            entry.unauthorized += 1
+            self.quarantine(entry)
+            print(f"⚠️ {entry.name} was rejected by Roblox (401). Quarantined for {entry.quarantined_until - time.monotonic():.0f}s.")
+        elif status == 429:
+            entry.throttled += 1
+            self.quarantine(entry, parse_header_number(headers.get("Retry-After")))
+        else:
+            entry.successes += 1
+            entry.strikes = 0
+
+    def quarantine(self, entry: CookieHealth, minimum=None):
+        entry.strikes += 1
+        duration = min(COOKIE_QUARANTINE_MAX, COOKIE_QUARANTINE_BASE * 2 ** (entry.strikes - 1))
+        if minimum:
+            duration = max(duration, minimum)
+        entry.quarantined_until = time.monotonic() + duration
+
+    def stats(self) -> dict:
+        return {entry.name: entry.stats() for entry in self.entries}
+
+cookie_pool = CookiePool(ROBLOX_COOKIES)
+
+# Shared HTTP client: one pooled, keep-alive session for every Roblox API call
+HTTP_TIMEOUT = 10  # Default per-request timeout in seconds
+HTTP_CONNECTIONS_PER_HOST = 10  # Keep-alive connections kept open to each Roblox host
+
+http_session = None
+
+class RobloxAPIError(Exception):
+    """
+    Raised when a Roblox API request fails (network error, timeout, bad payload or non-2xx status).
+    """
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Return the shared aiohttp session, creating it on first use inside the event loop.
+    """
+    global http_session
+    if http_session is None or http_session.closed:
+        connector = aiohttp.TCPConnector(limit_per_host=HTTP_CONNECTIONS_PER_HOST, keepalive_timeout=60, ttl_dns_cache=300)
+        http_session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT))
+    return http_session
+
+async def close_http_session():
+    global http_session
+    if http_session is not None and not http_session.closed:
+        await http_session.close()
+    http_session = None
+
+# Roblox throttles each API family separately: host -> family, and family -> (requests, per seconds).
+# The limits are starting points; the buckets adopt whatever x-ratelimit-* headers Roblox sends back.
+ROBLOX_ENDPOINT_FAMILIES = {
+    "presence.roblox.com": "presence",
+    "users.roblox.com": "users",
+    "thumbnails.roblox.com": "thumbnails",
+    "economy.roblox.com": "economy",
+    "catalog.roblox.com": "catalog",
+    "groups.roblox.com": "groups",
+    "games.roblox.com": "games"
+}
+RATE_LIMITS = {
+    "presence": (100, 60),
+    "users": (60, 60),
+    "thumbnails": (100, 60),
+    "economy": (60, 60),
+    "catalog": (60, 60),
+    "groups": (60, 60),
+    "games": (60, 60)
+}
+RATE_LIMIT_MAX_RETRIES = 3  # Times a throttled request is queued again before giving up
+RATE_LIMIT_DEFAULT_RETRY_AFTER = 5  # seconds to back off when a 429 has no usable Retry-After header
+
+def parse_header_number(value):
+    """
+    Parse the leading number of a rate limit header such as "60" or "60, 60;w=60".
+    """
+    try:
+        return float(str(value).split(",")[0].split(";")[0].strip())
+    except (TypeError, ValueError):
+        return None
+
+def parse_rate_limit_policies(value) -> list:
+    """
+    Parse the (limit, window) policy pairs of an x-ratelimit-limit header such as
+    "100, 100;w=60, 1000;w=3600". A bare number (the limit that currently applies) is only used
+    when the header carries no policy with a window, and then counts as a 60 second window.
+    """
+    policies = []
+    bare_limit = None
+    for item in str(value).split(","):
+        parts = [part.strip() for part in item.split(";")]
+        limit = parse_header_number(parts[0])
+        if limit is None:
+            continue
+        window = None
+        for parameter in parts[1:]:
+            if parameter.startswith("w="):
+                window = parse_header_number(parameter[2:])
+        if window:
+            policies.append((limit, window))
+        elif bare_limit is None:
+            bare_limit = limit
+    if not policies and bare_limit:
+        policies.append((bare_limit, 60.0))
+    return policies
+
+class TokenBucket:
+    """
+    Token bucket for one endpoint family. Callers queue on acquire() in FIFO order and are
+    delayed, not failed, while the family is out of tokens or blocked by a 429.
+    """
+    def __init__(self, limit: float, window: float):
+        self.capacity = limit
+        self.rate = limit / window  # tokens per second
+        self.tokens = limit
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.waited = 0.0  # Total seconds callers were held back, so throttling can be told apart from slow responses
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.blocked_until:
+                    delay = self.blocked_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    delay = (1 - self.tokens) / self.rate
+                self.waited += delay
+                await asyncio.sleep(delay)
+
+    def block_for(self, seconds: float):
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+    def update_from_headers(self, headers):
+        """
+        Adopt the limit Roblox reports and never assume more tokens than it says are left.
+        """
+        policies = [(limit, window) for limit, window in parse_rate_limit_policies(headers.get("x-ratelimit-limit")) if limit > 0]
+        if policies:
+            # Several windows can apply at once: pace requests by the slowest rate, and never
+            # burst beyond the smallest limit
+            self.capacity = min(limit for limit, _ in policies)
+            self.rate = min(limit / window for limit, window in policies)
+
+        remaining = parse_header_number(headers.get("x-ratelimit-remaining"))
+        if remaining is not None:
+            self.tokens = min(self.tokens, remaining)
+            reset = parse_header_number(headers.get("x-ratelimit-reset"))
+            if remaining < 1 and reset:
+                self.block_for(reset)
+
+class RobloxRateLimiter:
+    """
+    One token bucket per Roblox endpoint family, shared by every request made through roblox_request().
+    """
+    def __init__(self, limits: dict):
+        self.limits = limits
+        self.buckets = {}
+        self.throttled = {}  # family -> number of 429 responses received
+
+    def bucket(self, family: str) -> TokenBucket:
+        if family not in self.buckets:
+            self.buckets[family] = TokenBucket(*self.limits.get(family, (60, 60)))
+        return self.buckets[family]
+
+    async def acquire(self, family: str):
+        await self.bucket(family).acquire()
+
+    def observe(self, family: str, status: int, headers) -> float:
+        """
+        Record a response. Returns how long to back off if Roblox throttled it, otherwise 0.
+        """
+        bucket = self.bucket(family)
+        bucket.update_from_headers(headers)
+        if status != 429:
+            return 0
+
+        self.throttled[family] = self.throttled.get(family, 0) + 1
+        retry_after = parse_header_number(headers.get("Retry-After")) or parse_header_number(headers.get("x-ratelimit-reset"))
+        retry_after = retry_after if retry_after and retry_after > 0 else RATE_LIMIT_DEFAULT_RETRY_AFTER
+        bucket.block_for(retry_after)
+        print(f"⚠️ Roblox {family} API rate limited. Backing off for {retry_after:.1f}s.")
+        return retry_after
+
+rate_limiter = RobloxRateLimiter(RATE_LIMITS)
+
+def get_endpoint_family(url: str):
+    return ROBLOX_ENDPOINT_FAMILIES.get(urlsplit(url).hostname)
+
+async def roblox_request(method: str, url: str, *, params=None, json_data=None, authenticated=False, credential=None, timeout=None, as_text=False):
+    """
+    Perform a Roblox API request through the shared session.
+    Requests wait for their endpoint family's rate limit, and throttled (429) requests are queued
+    again after the Retry-After delay instead of failing straight away. Authenticated requests use
+    the healthiest cookie in the pool, or the given credential when one is passed.
+    Returns the decoded JSON body (or the raw text when as_text is set) and raises RobloxAPIError on failure.
+    """
+    request_kwargs = {"params": params, "json": json_data}
+    if timeout is not None:
+        request_kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+    family = get_endpoint_family(url)
+    for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+        if family:
+            await rate_limiter.acquire(family)
+
+        # Pick the healthiest cookie for every attempt, so a throttled cookie is not reused for the retry
+        entry = credential if credential is not None else (cookie_pool.acquire() if authenticated else None)
+        if credential is not None:
+            credential.in_flight += 1
+        headers = {"Cookie": f".ROBLOSECURITY={entry.cookie}"} if entry else {}
+
+        status = None
+        response_headers = None
+        cancelled = False
+        try:
+            async with get_http_session().request(method, url, headers=headers, **request_kwargs) as response:
+                status, response_headers = response.status, response.headers
+                if family and rate_limiter.observe(family, response.status, response.headers) and attempt < RATE_LIMIT_MAX_RETRIES:
+                    continue  # The bucket is now blocked for Retry-After; wait our turn again
+                if response.status >= 400:
+                    raise RobloxAPIError(f"{method} {url} returned HTTP {response.status}", status=response.status)
+                if as_text:
+                    return await response.text()
+                return await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            raise RobloxAPIError(f"{method} {url} failed: {e}") from e
+        except asyncio.CancelledError:
+            cancelled = True  # Such as a check_status deadline; not the cookie's fault
+            raise
+        finally:
+            if entry:
+                cookie_pool.release(entry, status, response_headers, cancelled)
+
+async def validate_cookies():
+    """
+    Check every configured cookie once at startup and quarantine the ones Roblox rejects.
+    """
+    if not cookie_pool.entries:
+        print("⚠️ No ROBLOX_COOKIE_* variables are set. Authenticated requests will be sent without a cookie.")
+        return
+
+    for entry in cookie_pool.entries:
+        try:
+            account = await roblox_request("GET", COOKIE_VALIDATION_URL, credential=entry)
+            print(f"✅ {entry.name} is valid (authenticated as {account.get('name', 'unknown')}).")
+        except RobloxAPIError as e:
+            log_error(e)
+            print(f"⚠️ {entry.name} failed validation: {e}")
 
 if not TOKEN:
     raise EnvironmentError("DISCORD_TOKEN is not set in the environment variables.")
 
-# Load server-specific user IDs from file
+# Load server-specific user IDs from the legacy JSON file
 def load_server_user_ids():
     try:
         with open(SERVER_USER_IDS_FILE, 'r') as file:
@@ -52,35 +392,288 @@ def load_server_user_ids():
         print(f"Failed to load server user IDs: {e}")
         return {}
 
-# Save server-specific user IDs to file
-def save_server_user_ids():
-    try:
-        with open(SERVER_USER_IDS_FILE, 'w') as file:
-            json.dump(server_user_ids, file, indent=4)
-    except Exception as e:
-        log_error(e)
-        print(f"Failed to save server user IDs: {e}")
+DATABASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS tracked_users (
+    guild_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    added_at REAL NOT NULL,
+    PRIMARY KEY (guild_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS tracked_users_by_user ON tracked_users (user_id);
+CREATE TABLE IF NOT EXISTS tracked_items (
+    guild_id TEXT NOT NULL,
+    item_id INTEGER NOT NULL,
+    last_price INTEGER,
+    added_at REAL NOT NULL,
+    PRIMARY KEY (guild_id, item_id)
+);
+CREATE INDEX IF NOT EXISTS tracked_items_by_item ON tracked_items (item_id);
+CREATE TABLE IF NOT EXISTS price_history (
+    item_id INTEGER NOT NULL,
+    observed_at REAL NOT NULL,
+    price INTEGER
+);
+CREATE INDEX IF NOT EXISTS price_history_by_item_time ON price_history (item_id, observed_at);
+CREATE TABLE IF NOT EXISTS group_watches (
+    guild_id TEXT NOT NULL,
+    group_id INTEGER NOT NULL,
+    added_at REAL NOT NULL,
+    PRIMARY KEY (guild_id, group_id)
+);
+CREATE INDEX IF NOT EXISTS group_watches_by_group ON group_watches (group_id);
+CREATE TABLE IF NOT EXISTS watched_places (
+    guild_id TEXT NOT NULL,
+    place_id INTEGER NOT NULL,
+    universe_id INTEGER,
+    added_at REAL NOT NULL,
+    PRIMARY KEY (guild_id, place_id)
+);
+CREATE TABLE IF NOT EXISTS status_subscriptions (
+    guild_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    added_at REAL NOT NULL,
+    PRIMARY KEY (guild_id, user_id, status)
+);
+CREATE INDEX IF NOT EXISTS status_subscriptions_by_target ON status_subscriptions (user_id, status);
+CREATE TABLE IF NOT EXISTS presence_snapshot (
+    guild_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    last_status TEXT NOT NULL,
+    PRIMARY KEY (guild_id, user_id)
+);
+"""
+
+class SoulStore:
+    """
+    SQLite storage for the bot's persistent state.
+    The database runs in WAL mode and every write is a small incremental statement executed
+    on a dedicated worker thread, so tracking changes never block the event loop.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._connection = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="soul-store")
+
+    def open(self):
+        # Only the worker thread touches the connection once the bot is running
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(DATABASE_SCHEMA)
+        self._connection.commit()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    async def run(self, function, *args):
+        """
+        Run a blocking database function on the store's worker thread.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    def _write(self, sql: str, params=()):
+        with self._connection:  # Commits on success, rolls back on error
+            self._connection.execute(sql, params)
+
+    def import_server_user_ids(self, json_file: str):
+        """
+        Import the legacy server_user_ids.json file the first time the database is used.
+        """
+        imported = self._connection.execute("SELECT value FROM meta WHERE key = 'imported_server_user_ids'").fetchone()
+        if imported or not os.path.exists(json_file):
+            return
+
+        legacy_user_ids = load_server_user_ids()
+        now = time.time()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO tracked_users (guild_id, user_id, added_at) VALUES (?, ?, ?)",
+                [(str(guild_id), str(user_id), now) for guild_id, user_ids in legacy_user_ids.items() for user_id in user_ids]
+            )
+            self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('imported_server_user_ids', ?)", (str(now),))
+        print(f"Imported tracked users for {len(legacy_user_ids)} servers from {json_file}.")
+
+    def load_tracked_users(self) -> dict:
+        tracked_users = {}
+        for guild_id, user_id in self._connection.execute("SELECT guild_id, user_id FROM tracked_users ORDER BY rowid"):
+            tracked_users.setdefault(guild_id, []).append(user_id)
+        return tracked_users
+
+    async def add_tracked_user(self, guild_id: str, user_id: str):
+        await self.run(self._write, "INSERT OR IGNORE INTO tracked_users (guild_id, user_id, added_at) VALUES (?, ?, ?)", (guild_id, user_id, time.time()))
+
+    async def remove_tracked_user(self, guild_id: str, user_id: str):
+        await self.run(self._write, "DELETE FROM tracked_users WHERE guild_id = ? AND user_id = ?", (guild_id, user_id))
 
-# Dictionary to store user IDs for each server
-server_user_ids = load_server_user_ids()
+    def _remove_guild(self, guild_id: str):
+        with self._connection:  # One transaction, so a crash never leaves part of the guild behind
+            for table in ("tracked_users", "tracked_items", "group_watches", "watched_places", "status_subscriptions"):
+                self._connection.execute(f"DELETE FROM {table} WHERE guild_id = ?", (guild_id,))
 
-# Dictionary to store tracked items per server
-server_item_ids = {}
+    async def remove_guild(self, guild_id: str):
+        await self.run(self._remove_guild, guild_id)
+
+    def _is_user_tracked(self, user_id: str) -> bool:
+        return self._connection.execute("SELECT 1 FROM tracked_users WHERE user_id = ? LIMIT 1", (user_id,)).fetchone() is not None
+
+    async def is_user_tracked(self, user_id: str) -> bool:
+        return await self.run(self._is_user_tracked, user_id)
+
+    def load_tracked_items(self) -> dict:
+        tracked_items = {}
+        for guild_id, item_id, last_price in self._connection.execute("SELECT guild_id, item_id, last_price FROM tracked_items ORDER BY rowid"):
+            tracked_items.setdefault(guild_id, {})[item_id] = {"last_price": last_price}
+        return tracked_items
+
+    async def add_tracked_item(self, guild_id: str, item_id: int, last_price):
+        await self.run(self._write, "INSERT OR IGNORE INTO tracked_items (guild_id, item_id, last_price, added_at) VALUES (?, ?, ?, ?)", (guild_id, item_id, last_price, time.time()))
+
+    def _record_item_prices(self, prices: dict, observed_at: float):
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO price_history (item_id, observed_at, price) VALUES (?, ?, ?)",
+                [(item_id, observed_at, price) for item_id, price in prices.items()]
+            )
+            self._connection.executemany(
+                "UPDATE tracked_items SET last_price = ? WHERE item_id = ?",
+                [(price, item_id) for item_id, price in prices.items()]
+            )
+
+    async def record_item_prices(self, prices: dict, observed_at=None):
+        """
+        Append one price observation per item to the history and update every registration's last price.
+        """
+        if prices:
+            await self.run(self._record_item_prices, prices, observed_at or time.time())
+
+    def _get_price_history(self, item_id: int, since, until) -> list:
+        return self._connection.execute(
+            "SELECT observed_at, price FROM price_history WHERE item_id = ? AND observed_at >= ? AND observed_at <= ? ORDER BY observed_at",
+            (item_id, since if since is not None else 0, until if until is not None else time.time())
+        ).fetchall()
+
+    async def get_price_history(self, item_id: int, since=None, until=None) -> list:
+        """
+        Return (observed_at, price) rows for an item, oldest first, optionally limited to a time range.
+        """
+        return await self.run(self._get_price_history, item_id, since, until)
+
+    def load_group_watches(self) -> dict:
+        group_watches = {}
+        for guild_id, group_id in self._connection.execute("SELECT guild_id, group_id FROM group_watches ORDER BY rowid"):
+            group_watches.setdefault(guild_id, []).append(group_id)
+        return group_watches
+
+    async def add_group_watch(self, guild_id: str, group_id: int):
+        await self.run(self._write, "INSERT OR IGNORE INTO group_watches (guild_id, group_id, added_at) VALUES (?, ?, ?)", (guild_id, group_id, time.time()))
+
+    async def remove_group_watch(self, guild_id: str, group_id: int):
+        await self.run(self._write, "DELETE FROM group_watches WHERE guild_id = ? AND group_id = ?", (guild_id, group_id))
+
+    def load_status_subscriptions(self) -> list:
+        return self._connection.execute("SELECT guild_id, user_id, status FROM status_subscriptions ORDER BY rowid").fetchall()
+
+    async def add_status_subscription(self, guild_id: str, user_id: str, status: str):
+        await self.run(self._write, "INSERT OR IGNORE INTO status_subscriptions (guild_id, user_id, status, added_at) VALUES (?, ?, ?, ?)", (guild_id, user_id, status, time.time()))
+
+    async def remove_status_subscription(self, guild_id: str, user_id: str, status=None):
+        """
+        Remove one of a guild's subscriptions to a user, or all of them when no status is given.
+        """
+        if status is None:
+            await self.run(self._write, "DELETE FROM status_subscriptions WHERE guild_id = ? AND user_id = ?", (guild_id, user_id))
+        else:
+            await self.run(self._write, "DELETE FROM status_subscriptions WHERE guild_id = ? AND user_id = ? AND status = ?", (guild_id, user_id, status))
+
+    def load_presence_snapshot(self) -> dict:
+        """
+        Return the last announced status of every tracked user, as {guild_id: {user_id: status}}.
+        Users who are no longer tracked are left out.
+        """
+        snapshot = {}
+        rows = self._connection.execute(
+            "SELECT presence_snapshot.guild_id, presence_snapshot.user_id, presence_snapshot.last_status FROM presence_snapshot "
+            "JOIN tracked_users ON tracked_users.guild_id = presence_snapshot.guild_id AND tracked_users.user_id = presence_snapshot.user_id"
+        )
+        for guild_id, user_id, last_status in rows:
+            snapshot.setdefault(guild_id, {})[user_id] = last_status
+        return snapshot
+
+    def _save_presence_snapshot(self, rows: list):
+        with self._connection:
+            self._connection.execute("DELETE FROM presence_snapshot")
+            self._connection.executemany("INSERT INTO presence_snapshot (guild_id, user_id, last_status) VALUES (?, ?, ?)", rows)
+            self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('presence_snapshot_saved_at', ?)", (str(time.time()),))
+
+    async def save_presence_snapshot(self, rows: list):
+        """
+        Replace the stored snapshot with (guild_id, user_id, last_status) rows.
+        """
+        await self.run(self._save_presence_snapshot, rows)
+
+    def load_watched_places(self) -> dict:
+        watched_places = {}
+        for guild_id, place_id, universe_id in self._connection.execute("SELECT guild_id, place_id, universe_id FROM watched_places ORDER BY rowid"):
+            watched_places.setdefault(guild_id, {})[place_id] = universe_id
+        return watched_places
+
+    async def add_watched_place(self, guild_id: str, place_id: int, universe_id):
+        await self.run(self._write, "INSERT OR IGNORE INTO watched_places (guild_id, place_id, universe_id, added_at) VALUES (?, ?, ?, ?)", (guild_id, place_id, universe_id, time.time()))
+
+    async def remove_watched_place(self, guild_id: str, place_id: int):
+        await self.run(self._write, "DELETE FROM watched_places WHERE guild_id = ? AND place_id = ?", (guild_id, place_id))
+
+soul_store = SoulStore(DATABASE_FILE)
+soul_store.open()
+soul_store.import_server_user_ids(SERVER_USER_IDS_FILE)
+
+# Dictionary to store user IDs for each server (an in-memory view of the tracked_users table)
+server_user_ids = soul_store.load_tracked_users()
+
+# Dictionary to store tracked items per server (an in-memory view of the tracked_items table)
+server_item_ids = soul_store.load_tracked_items()
+
+# Places each server wants game-join alerts for: guild_id -> {place_id: universe_id}
+server_place_ids = soul_store.load_watched_places()
 
 intents = discord.Intents.all()
-bot = commands.Bot(command_prefix="!", intents=intents)
+
+class SoulBot(commands.Bot):
+    async def setup_hook(self):
+        # Find out which Roblox cookies actually work before any task starts using them
+        await validate_cookies()
+        event_bus.start()
+
+    async def close(self):
+        # Persist resolved usernames and release pooled Roblox connections before shutting down
+        await username_resolver.close()
+        check_status.cancel()
+        await group_watches.cancel_polls()
+        # Deliver what is already queued, then save the snapshot; anything still undelivered is left out of it
+        await event_bus.drain(SHUTDOWN_DRAIN_SECONDS)
+        await event_bus.stop()
+        await notification_outbox.close()
+        await save_presence_snapshot()
+        await close_http_session()
+        await super().close()
+        soul_store.close()
+
+SHUTDOWN_DRAIN_SECONDS = 10  # How long shutdown waits for queued notifications to be delivered
+
+bot = SoulBot(command_prefix="!", intents=intents)
 
 # Use the existing bot.tree instead of creating a new CommandTree
 tree = bot.tree
 
-# Tracks previous statuses per server
-data_cache = {}
-
 GROUP_ID = 15574158
-group_cache = {
-    "members": set(),
-    "last_shout": None
-}
 
 # Mapping ROBLOX status codes
 STATUS_MAP = {
@@ -89,6 +682,254 @@ STATUS_MAP = {
     2: "In Game",
     3: "In Studio"
 }
+STATUS_CODES = {status: code for code, status in STATUS_MAP.items()}
+UNKNOWN_STATUS_CODE = -1  # A presence type missing from STATUS_MAP
+NO_STATUS_CODE = -2  # Not polled yet
+UNSEEN_LOCATION = ()  # Where a user is before their first poll
+STATUS_NAMES = {**STATUS_MAP, UNKNOWN_STATUS_CODE: "Unknown"}
+
+# Flap suppression: a new status is only announced once it has held for PRESENCE_DEBOUNCE_SECONDS,
+# and never sooner than PRESENCE_MIN_DWELL_SECONDS after the previous announcement for that user
+PRESENCE_DEBOUNCE_SECONDS = 30
+PRESENCE_MIN_DWELL_SECONDS = 60
+
+class PresenceRecord:
+    """
+    The last announced status of one Roblox user, shared by every guild tracking them, along with
+    the user's polling schedule (kept here by PresenceScheduler).
+    """
+    __slots__ = (
+        "status", "announced_at", "pending_status", "pending_since", "guild_ids", "unannounced",
+        "next_poll", "interval", "polled_status", "location"
+    )
+
+    def __init__(self):
+        self.location = UNSEEN_LOCATION  # (place_id, game_id) while in a game, None otherwise
+        self.next_poll = 0.0  # Due immediately
+        self.interval = 0.0  # Seconds until the next poll; set after the first poll
+        self.polled_status = NO_STATUS_CODE  # Status seen on the latest poll, announced or not
+        self.status = NO_STATUS_CODE
+        self.announced_at = 0.0
+        self.pending_status = NO_STATUS_CODE  # A different status seen since the last announcement, not yet confirmed
+        self.pending_since = 0.0
+        self.guild_ids = ()  # Guilds tracking the user
+        self.unannounced = None  # Set of guilds that started tracking the user after their status was last announced
+
+class PresenceStateStore:
+    """
+    Remembers which status was last announced for every tracked user, so only changes are posted.
+    There is one PresenceRecord per unique Roblox user, holding the status as a small integer code,
+    and a separate guild -> users index; diffing a tick's statuses is a single pass over the
+    polled users, however many guilds track each of them.
+
+    Transitions are filtered before they are announced: "Unknown" is never treated as a status,
+    a new status has to be seen for PRESENCE_DEBOUNCE_SECONDS (and the previous one announced at
+    least PRESENCE_MIN_DWELL_SECONDS ago) before it is announced, and a user who goes A -> B -> A
+    within that window is not announced at all.
+    """
+    def __init__(self):
+        self._records = {}  # user_id -> PresenceRecord
+        self._guild_users = {}  # guild_id -> set of user IDs
+
+    def _add(self, guild_id, user_id, announced=False):
+        record = self._records.get(user_id)
+        if record is None:
+            record = self._records[user_id] = PresenceRecord()
+        self._guild_users.setdefault(guild_id, set()).add(user_id)
+        if guild_id in record.guild_ids:
+            return
+        record.guild_ids += (guild_id,)
+        # A guild that starts tracking an already known user still gets a first status update
+        if not announced and record.status != NO_STATUS_CODE:
+            if record.unannounced is None:
+                record.unannounced = set()
+            record.unannounced.add(guild_id)
+
+    def _remove(self, guild_id, user_id):
+        record = self._records.get(user_id)
+        if record is None:
+            return
+        record.guild_ids = tuple(tracking_guild_id for tracking_guild_id in record.guild_ids if tracking_guild_id != guild_id)
+        if record.unannounced:
+            record.unannounced.discard(guild_id)
+            if not record.unannounced:
+                record.unannounced = None
+        if not record.guild_ids:
+            del self._records[user_id]
+
+    def restore(self, snapshot: dict):
+        """
+        Load the statuses announced before the last shutdown ({guild_id: {user_id: status}}).
+        """
+        for guild_id, statuses in snapshot.items():
+            for user_id, status in statuses.items():
+                self._add(guild_id, user_id, announced=True)
+                self._records[user_id].status = STATUS_CODES.get(status, UNKNOWN_STATUS_CODE)
+
+    def sync(self, guild_user_ids: dict) -> dict:
+        """
+        Bring the index in line with the users each guild tracks.
+        Returns the users each guild started tracking, as {guild_id: [user_id]}.
+        """
+        for guild_id in self._guild_users.keys() - guild_user_ids.keys():
+            for user_id in self._guild_users.pop(guild_id):
+                self._remove(guild_id, user_id)
+
+        added = {}
+        for guild_id, user_ids in guild_user_ids.items():
+            tracked = set(user_ids)
+            indexed = self._guild_users.get(guild_id, set())
+            if tracked == indexed:
+                continue
+            for user_id in indexed - tracked:
+                self._remove(guild_id, user_id)
+            added[guild_id] = list(tracked - indexed)
+            for user_id in added[guild_id]:
+                self._add(guild_id, user_id)
+            self._guild_users[guild_id] = tracked
+        return added
+
+    def mark_unannounced(self, user_id, guild_ids):
+        """
+        Announce a user's status to these guilds again the next time the user is polled, for
+        announcements that were lost before they were sent.
+        """
+        record = self._records.get(user_id)
+        if record is None:
+            return
+        guild_ids = [guild_id for guild_id in guild_ids if guild_id in record.guild_ids]
+        if guild_ids:
+            if record.unannounced is None:
+                record.unannounced = set()
+            record.unannounced.update(guild_ids)
+
+    def get(self, user_id):
+        return self._records.get(user_id)
+
+    def records(self):
+        return self._records.values()
+
+    def guild_user_ids(self, guild_id) -> set:
+        return self._guild_users.get(guild_id, set())
+
+    def guild_ids(self):
+        return self._guild_users.keys()
+
+    def diff(self, statuses: dict) -> list:
+        """
+        Record a tick's statuses and return (user_id, status, guild_ids) for every status that has
+        to be announced, along with the guilds it has to be announced to.
+        """
+        now = time.monotonic()
+        changes = []
+        for user_id, status in statuses.items():
+            record = self._records.get(user_id)
+            code = STATUS_CODES.get(status, UNKNOWN_STATUS_CODE)
+            if record is None or code == UNKNOWN_STATUS_CODE:
+                continue
+
+            if code == record.status:
+                record.pending_status = NO_STATUS_CODE  # Back where it was: the bounce is not announced
+                if record.unannounced:
+                    changes.append((user_id, status, tuple(record.unannounced)))
+                    record.unannounced = None
+                continue
+
+            # The first status of a user is announced straight away; later ones have to settle first
+            if record.status != NO_STATUS_CODE:
+                if code != record.pending_status:
+                    record.pending_status = code
+                    record.pending_since = now
+                if now - record.pending_since < PRESENCE_DEBOUNCE_SECONDS or now - record.announced_at < PRESENCE_MIN_DWELL_SECONDS:
+                    continue
+
+            record.status = code
+            record.announced_at = now
+            record.pending_status = NO_STATUS_CODE
+            record.unannounced = None
+            changes.append((user_id, status, record.guild_ids))
+        return changes
+
+    def snapshot_rows(self, undelivered=frozenset()) -> list:
+        """
+        Return (guild_id, user_id, status) for every status announced to a guild, except the
+        (guild_id, user_id) pairs in `undelivered`, whose announcement has not been sent yet.
+        """
+        rows = []
+        for user_id, record in self._records.items():
+            if record.status == NO_STATUS_CODE:
+                continue
+            status = STATUS_NAMES[record.status]
+            for guild_id in record.guild_ids:
+                if record.unannounced and guild_id in record.unannounced:
+                    continue
+                if (guild_id, user_id) not in undelivered:
+                    rows.append((guild_id, user_id, status))
+        return rows
+
+    def stats(self) -> dict:
+        return {
+            "users": len(self._records),
+            "guilds": len(self._guild_users),
+            "pairs": sum(len(user_ids) for user_ids in self._guild_users.values())
+        }
+
+class StatusSubscriptionIndex:
+    """
+    The statuses each guild wants announced for its tracked users, indexed by (user_id, status).
+    A guild with no subscriptions for a user gets every status change of that user, as it did
+    before /subscribe existed; once it subscribes to some statuses, only those are announced.
+    """
+    def __init__(self, subscriptions):
+        self._guilds_by_target = {}  # (user_id, status) -> set of guild IDs subscribed to it
+        self._filtered_guilds = {}  # user_id -> {guild_id: set of statuses}
+        for guild_id, user_id, status in subscriptions:
+            self.add(guild_id, user_id, status)
+
+    def add(self, guild_id: str, user_id: str, status: str):
+        self._guilds_by_target.setdefault((user_id, status), set()).add(guild_id)
+        self._filtered_guilds.setdefault(user_id, {}).setdefault(guild_id, set()).add(status)
+
+    def remove(self, guild_id: str, user_id: str, status=None):
+        """
+        Remove one of a guild's subscriptions to a user, or all of them when no status is given.
+        """
+        guild_statuses = self._filtered_guilds.get(user_id, {}).get(guild_id, set())
+        for removed_status in ([status] if status is not None else list(guild_statuses)):
+            guild_statuses.discard(removed_status)
+            guild_ids = self._guilds_by_target.get((user_id, removed_status))
+            if guild_ids is not None:
+                guild_ids.discard(guild_id)
+                if not guild_ids:
+                    del self._guilds_by_target[(user_id, removed_status)]
+        if not guild_statuses and user_id in self._filtered_guilds:
+            self._filtered_guilds[user_id].pop(guild_id, None)
+            if not self._filtered_guilds[user_id]:
+                del self._filtered_guilds[user_id]
+
+    def remove_guild(self, guild_id: str):
+        for user_id in [user_id for user_id, guilds in self._filtered_guilds.items() if guild_id in guilds]:
+            self.remove(guild_id, user_id)
+
+    def statuses_for(self, guild_id: str, user_id: str) -> set:
+        return set(self._filtered_guilds.get(user_id, {}).get(guild_id, ()))
+
+    def recipients(self, user_id: str, status: str, guild_ids) -> tuple:
+        """
+        Return the guilds among `guild_ids` that want this status change of the user announced.
+        """
+        filtered_guilds = self._filtered_guilds.get(user_id)
+        if not filtered_guilds:
+            return tuple(guild_ids)
+        subscribed = self._guilds_by_target.get((user_id, status), ())
+        return tuple(guild_id for guild_id in guild_ids if guild_id not in filtered_guilds or guild_id in subscribed)
+
+status_subscriptions = StatusSubscriptionIndex(soul_store.load_status_subscriptions())
+
+# Tracks the last announced statuses, warm-started from the snapshot taken before the last shutdown
+# so a restart does not announce every tracked user's status again
+presence_states = PresenceStateStore()
+presence_states.restore(soul_store.load_presence_snapshot())
 
 LAST_CHANGELOG_FILE = "last_changelog.json"
 VERSION_FILE = "roblox_version.json"
@@ -163,32 +1004,279 @@ def extract_latest_changelog(changelog_content: str) -> str:
         print("Failed to extract the latest changelog entry.")
         return "Failed to extract the latest changelog entry."
 
-def get_roblox_presence(user_id: str) -> str:
-    url = "https://presence.roblox.com/v1/presence/users"
-    headers = {
-        "Content-Type": "application/json",
-        "Cookie": f".ROBLOSECURITY={get_next_cookie()}"
+# The presence endpoint accepts a list of user IDs, so one request covers a whole batch
+PRESENCE_URL = "https://presence.roblox.com/v1/presence/users"
+PRESENCE_BATCH_SIZE = 50
+
+def parse_presence(user_data: dict) -> dict:
+    """
+    Keep the parts of a userPresences entry the bot uses: the status and, for users in a game
+    whose privacy settings allow it, where they are.
+    """
+    return {
+        "status": STATUS_MAP.get(user_data.get("userPresenceType"), "Unknown"),
+        "place_id": user_data.get("placeId"),
+        "universe_id": user_data.get("universeId"),
+        "game_id": user_data.get("gameId"),
+        "last_location": user_data.get("lastLocation")
     }
-    json_data = {"userIds": [int(user_id)]}
 
-    try:
-        response = requests.post(url, json=json_data, headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        user_data = data["userPresences"][0]
-        status = STATUS_MAP.get(user_data["userPresenceType"], "Unknown")
-        return status
-    except Exception as e:
-        log_error(e)
-        print(f"Failed to get status for user {user_id}: {e}")
-        return "Unknown"
+async def get_roblox_presence_details_batch(user_ids) -> dict:
+    """
+    Fetch the full presence of many Roblox users with as few requests as possible.
+    Duplicate IDs are collapsed and the rest are sent in batches of PRESENCE_BATCH_SIZE.
+    Returns a mapping of user ID (as a string) to parse_presence() output; users whose presence
+    could not be fetched are left out.
+    """
+    unique_ids = list(dict.fromkeys(str(user_id) for user_id in user_ids))
+    presences = {}
+
+    for start in range(0, len(unique_ids), PRESENCE_BATCH_SIZE):
+        batch = unique_ids[start:start + PRESENCE_BATCH_SIZE]
+        json_data = {"userIds": [int(user_id) for user_id in batch]}
+
+        try:
+            data = await roblox_request("POST", PRESENCE_URL, json_data=json_data, authenticated=True)
+            for user_data in data.get("userPresences", []):
+                presences[str(user_data["userId"])] = parse_presence(user_data)
+        except Exception as e:
+            # Leave the batch out rather than report "Unknown", which would look like a status change
+            log_error(e)
+            print(f"Failed to get status for {len(batch)} users: {e}")
+
+    return presences
+
+async def get_roblox_presence_batch(user_ids) -> dict:
+    """
+    Like get_roblox_presence_details_batch, but returns only each user's status.
+    """
+    presences = await get_roblox_presence_details_batch(user_ids)
+    return {user_id: presence["status"] for user_id, presence in presences.items()}
+
+async def get_roblox_presence(user_id: str) -> str:
+    return (await get_roblox_presence_batch([user_id])).get(str(user_id), "Unknown")
+
+# Adaptive presence polling: every user has their own next-poll time
+PRESENCE_TICK_SECONDS = 5  # How often check_status looks for users that are due
+PRESENCE_POLL_FLOOR = 15  # seconds between polls right after a user's status changed
+PRESENCE_POLL_ACTIVE_CEILING = 60  # seconds; users who are online never back off further than this
+PRESENCE_POLL_CEILING = 10 * 60  # seconds between polls of a long-idle, offline user
+PRESENCE_POLL_BACKOFF = 1.5  # Interval multiplier after each poll without a change
+PRESENCE_REQUESTS_PER_SECOND = 1.0  # Hard budget of presence requests
+
+class PresenceScheduler:
+    """
+    Decides which tracked users are due for a presence poll.
+    A user's interval drops to PRESENCE_POLL_FLOOR whenever their status changes and grows by
+    PRESENCE_POLL_BACKOFF after every unchanged poll, up to a ceiling that is lower for users
+    who are online than for users who are offline.
+
+    Due users are handed out with weighted fair queueing across guilds: every guild has its own
+    queue and, round by round, each guild with due users may take up to its weight (the square
+    root of its tracked user count) before the next guild gets a turn. Small guilds are therefore
+    guaranteed a share of every tick's budget no matter how many users a large guild tracks.
+
+    The schedule itself lives in the PresenceStateStore's records, and the guild -> users index
+    is the store's; the scheduler only adds each guild's queue.
+    """
+    def __init__(self, states: PresenceStateStore):
+        self.states = states
+        self._guilds = {}  # guild_id -> {"queue": heap of (next_poll, user_id), "weight": int}
+
+    def _schedule(self, record, user_id, next_poll):
+        record.next_poll = next_poll
+        for guild_id in record.guild_ids:
+            guild = self._guilds.get(guild_id)
+            if guild is not None:
+                heapq.heappush(guild["queue"], (next_poll, user_id))
+
+    def sync(self, guild_user_ids: dict):
+        """
+        Bring the tracked users and the queues in line with the users each guild tracks.
+        Newly tracked users are due immediately.
+        """
+        added = self.states.sync(guild_user_ids)
+        for guild_id in self._guilds.keys() - self.states.guild_ids():
+            del self._guilds[guild_id]
+
+        for guild_id in self.states.guild_ids():
+            guild = self._guilds.get(guild_id)
+            if guild is None:
+                guild = self._guilds[guild_id] = {"queue": [], "weight": 1}
+                new_user_ids = self.states.guild_user_ids(guild_id)
+            elif guild_id in added:
+                new_user_ids = added[guild_id]
+            else:
+                continue
+
+            for user_id in new_user_ids:
+                heapq.heappush(guild["queue"], (self.states.get(user_id).next_poll, user_id))
+            tracked_count = len(self.states.guild_user_ids(guild_id))
+            guild["weight"] = math.isqrt(tracked_count - 1) + 1 if tracked_count else 1  # ceil(sqrt(n))
+
+    def _is_stale(self, guild_id, entry, taken=()):
+        next_poll, user_id = entry
+        record = self.states.get(user_id)
+        return record is None or record.next_poll != next_poll or guild_id not in record.guild_ids or user_id in taken
+
+    def _pop_due(self, guild_id, now, taken):
+        queue = self._guilds[guild_id]["queue"]
+        while queue:
+            if self._is_stale(guild_id, queue[0], taken):
+                heapq.heappop(queue)
+            elif queue[0][0] <= now:
+                return heapq.heappop(queue)[1]
+            else:
+                break
+        return None
+
+    def pop_due(self, limit: int) -> list:
+        """
+        Take up to `limit` due users, shared fairly between guilds (most lagging guild first).
+        Every returned user must be handed back through record() or retry().
+        """
+        now = time.monotonic()
+        due = []
+        taken = set()
+        active_guilds = sorted(
+            (guild_id for guild_id, guild in self._guilds.items() if guild["queue"] and guild["queue"][0][0] <= now),
+            key=lambda guild_id: self._guilds[guild_id]["queue"][0][0]
+        )
+
+        while active_guilds and len(due) < limit:
+            still_active = []
+            for guild_id in active_guilds:
+                exhausted = False
+                for _ in range(self._guilds[guild_id]["weight"]):
+                    if len(due) >= limit:
+                        break
+                    user_id = self._pop_due(guild_id, now, taken)
+                    if user_id is None:
+                        exhausted = True
+                        break
+                    due.append(user_id)
+                    taken.add(user_id)
+                if not exhausted:
+                    still_active.append(guild_id)
+            active_guilds = still_active
+        return due
+
+    def record(self, user_id, status):
+        record = self.states.get(user_id)
+        if record is None:
+            return
+
+        code = STATUS_CODES.get(status, UNKNOWN_STATUS_CODE)
+        if code != record.polled_status:
+            record.interval = PRESENCE_POLL_FLOOR
+        else:
+            ceiling = PRESENCE_POLL_CEILING if status == "Offline" else PRESENCE_POLL_ACTIVE_CEILING
+            record.interval = min(ceiling, max(PRESENCE_POLL_FLOOR, record.interval * PRESENCE_POLL_BACKOFF))
+        record.polled_status = code
+        self._schedule(record, user_id, time.monotonic() + record.interval)
+
+    def retry(self, user_id, delay=PRESENCE_POLL_FLOOR):
+        """
+        Put a user whose poll did not complete back in the queue without touching their interval.
+        """
+        record = self.states.get(user_id)
+        if record is not None:
+            self._schedule(record, user_id, time.monotonic() + delay)
+
+    def guild_lag(self) -> dict:
+        """
+        How many seconds each guild's most overdue user has been waiting for a poll (guilds with no lag are left out).
+        """
+        now = time.monotonic()
+        lags = {}
+        for guild_id, guild in self._guilds.items():
+            queue = guild["queue"]
+            while queue and self._is_stale(guild_id, queue[0]):
+                heapq.heappop(queue)
+            if queue and queue[0][0] < now:
+                lags[guild_id] = now - queue[0][0]
+        return lags
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        return {
+            "guilds": len(self._guilds),
+            "due": sum(1 for record in self.states.records() if record.next_poll <= now),
+            "queued": sum(len(guild["queue"]) for guild in self._guilds.values())
+        }
+
+presence_scheduler = PresenceScheduler(presence_states)
+
+class TTLCache:
+    """
+    Bounded in-memory cache with a per-entry time-to-live and least-recently-used eviction.
+    Counts hits and misses so callers can report how well it is working.
+    """
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (expires_at, value), least recently used first
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]  # Expired
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)  # Evict the least recently used entry
+
+    def invalidate(self, key):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+# Profile data (username, display name, description...) rarely changes, so keep it around for a while
+USER_DETAILS_CACHE_SIZE = 5000
+USER_DETAILS_CACHE_TTL = 15 * 60  # seconds
+user_details_cache = TTLCache(USER_DETAILS_CACHE_SIZE, USER_DETAILS_CACHE_TTL)
+
+def invalidate_user_details(user_id=None):
+    """
+    Drop cached profile data for one user, or for everyone when no user ID is given.
+    """
+    if user_id is None:
+        user_details_cache.clear()
+    else:
+        user_details_cache.invalidate(str(user_id))
+
+async def get_user_details(user_id: str):
+    cached_details = user_details_cache.get(str(user_id))
+    if cached_details is not None:
+        return dict(cached_details)
 
-def get_user_details(user_id: str):
     url = f"https://users.roblox.com/v1/users/{user_id}"
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        user_data = response.json()
+        user_data = await roblox_request("GET", url)
 
         display_name = user_data.get("displayName", "No display name")
         username = user_data.get("name", "No username")
@@ -196,13 +1284,17 @@ def get_user_details(user_id: str):
         is_banned = user_data.get("isBanned", False)
         created = user_data.get("created", "Unknown")
 
-        return {
+        user_details = {
             "display_name": display_name,
             "username": username,
             "description": description,
             "is_banned": is_banned,
             "created": created
         }
+        # "No username" means the lookup did not return a real profile, so never cache it
+        if username != "No username":
+            user_details_cache.set(str(user_id), user_details)
+        return dict(user_details)
 
     except Exception as e:
         log_error(e)
@@ -215,6 +1307,674 @@ def get_user_details(user_id: str):
             "created": "Unknown"
         }
 
+# Avatar headshots are resolved for many users per request and cached between ticks
+AVATAR_HEADSHOT_URL = "https://thumbnails.roblox.com/v1/users/avatar-headshot"
+THUMBNAIL_BATCH_SIZE = 100
+AVATAR_CACHE_SIZE = 5000
+AVATAR_CACHE_TTL = 60 * 60  # seconds
+AVATAR_RETRY_DELAY = 60  # seconds before asking again for a "Pending" or failed thumbnail
+
+_MISSING = object()
+
+class AvatarHeadshotResolver:
+    """
+    Resolves avatar headshot URLs with one multi-ID thumbnails request per batch of users.
+    Completed URLs are cached; thumbnails that are still "Pending" (or errored) are cached
+    as None for a short while so they are not refetched in a tight loop.
+    """
+    def __init__(self):
+        self.cache = TTLCache(AVATAR_CACHE_SIZE, AVATAR_CACHE_TTL)
+
+    async def resolve_many(self, user_ids) -> dict:
+        unique_ids = list(dict.fromkeys(str(user_id) for user_id in user_ids))
+        avatar_urls = {}
+        pending_ids = []
+
+        for user_id in unique_ids:
+            cached_url = self.cache.get(user_id, _MISSING)
+            if cached_url is _MISSING:
+                pending_ids.append(user_id)
+            else:
+                avatar_urls[user_id] = cached_url
+
+        for start in range(0, len(pending_ids), THUMBNAIL_BATCH_SIZE):
+            batch = pending_ids[start:start + THUMBNAIL_BATCH_SIZE]
+            params = {"userIds": ",".join(batch), "size": "352x352", "format": "Png", "isCircular": "false"}
+            try:
+                data = await roblox_request("GET", AVATAR_HEADSHOT_URL, params=params)
+            except RobloxAPIError as e:
+                log_error(e)
+                print(f"Failed to fetch avatar headshots for {len(batch)} users: {e}")
+                continue
+
+            for thumbnail in data.get("data", []):
+                user_id = str(thumbnail.get("targetId"))
+                image_url = thumbnail.get("imageUrl")
+                if thumbnail.get("state") == "Completed" and image_url:
+                    self.cache.set(user_id, image_url)
+                    avatar_urls[user_id] = image_url
+                else:
+                    # "Pending" thumbnails are still being rendered; check back later instead of right away
+                    self.cache.set(user_id, None, ttl=AVATAR_RETRY_DELAY)
+                    avatar_urls[user_id] = None
+
+        for user_id in unique_ids:
+            avatar_urls.setdefault(user_id, None)
+        return avatar_urls
+
+    async def resolve(self, user_id):
+        return (await self.resolve_many([user_id]))[str(user_id)]
+
+avatar_resolver = AvatarHeadshotResolver()
+
+# Place and universe names for game alerts, resolved many IDs per request and cached
+PLACE_DETAILS_URL = "https://games.roblox.com/v1/games/multiget-place-details"
+UNIVERSE_DETAILS_URL = "https://games.roblox.com/v1/games"
+GAME_METADATA_BATCH_SIZE = 50
+GAME_METADATA_CACHE_SIZE = 2000
+GAME_METADATA_CACHE_TTL = 6 * 60 * 60  # seconds; game names rarely change
+GAME_METADATA_RETRY_DELAY = 5 * 60  # seconds before looking up an unknown place or universe again
+
+class GameMetadataResolver:
+    """
+    Resolves place and universe metadata with one multi-ID games API request per batch.
+    Many users joining the same game cost a single lookup, and the result is cached for
+    everyone after them. Places or universes the API does not return are cached as None
+    for GAME_METADATA_RETRY_DELAY. Failed requests are logged and reported as None too, unless
+    the caller asks for them to be raised.
+    """
+    def __init__(self):
+        self.places = TTLCache(GAME_METADATA_CACHE_SIZE, GAME_METADATA_CACHE_TTL)
+        self.universes = TTLCache(GAME_METADATA_CACHE_SIZE, GAME_METADATA_CACHE_TTL)
+
+    async def _resolve_many(self, cache: TTLCache, ids, fetch_batch, raise_errors=False) -> dict:
+        unique_ids = list(dict.fromkeys(int(some_id) for some_id in ids if some_id))
+        resolved = {}
+        pending_ids = []
+
+        for some_id in unique_ids:
+            cached = cache.get(some_id, _MISSING)
+            if cached is _MISSING:
+                pending_ids.append(some_id)
+            else:
+                resolved[some_id] = cached
+
+        for start in range(0, len(pending_ids), GAME_METADATA_BATCH_SIZE):
+            batch = pending_ids[start:start + GAME_METADATA_BATCH_SIZE]
+            try:
+                fetched = await fetch_batch(batch)
+            except RobloxAPIError as e:
+                log_error(e)
+                print(f"Failed to fetch game metadata for {len(batch)} IDs: {e}")
+                if raise_errors:
+                    raise
+                continue
+            for some_id in batch:
+                metadata = fetched.get(some_id)
+                cache.set(some_id, metadata, ttl=None if metadata else GAME_METADATA_RETRY_DELAY)
+                resolved[some_id] = metadata
+
+        for some_id in unique_ids:
+            resolved.setdefault(some_id, None)
+        return resolved
+
+    async def _fetch_places(self, place_ids) -> dict:
+        # Place details are only served to signed-in requests
+        data = await roblox_request("GET", PLACE_DETAILS_URL, params={"placeIds": ",".join(map(str, place_ids))}, authenticated=True)
+        return {
+            place["placeId"]: {"name": place.get("name"), "universe_id": place.get("universeId")}
+            for place in data if place.get("placeId")
+        }
+
+    async def _fetch_universes(self, universe_ids) -> dict:
+        data = await roblox_request("GET", UNIVERSE_DETAILS_URL, params={"universeIds": ",".join(map(str, universe_ids))})
+        return {
+            universe["id"]: {"name": universe.get("name"), "root_place_id": universe.get("rootPlaceId"), "playing": universe.get("playing")}
+            for universe in data.get("data", []) if universe.get("id")
+        }
+
+    async def resolve_places(self, place_ids, raise_errors=False) -> dict:
+        """
+        Map place IDs to {"name", "universe_id"}, or None for places that could not be found.
+        With raise_errors, a failed lookup raises RobloxAPIError instead of reporting None.
+        """
+        return await self._resolve_many(self.places, place_ids, self._fetch_places, raise_errors)
+
+    async def resolve_universes(self, universe_ids) -> dict:
+        """
+        Map universe IDs to {"name", "root_place_id", "playing"}, or None for universes that could not be found.
+        """
+        return await self._resolve_many(self.universes, universe_ids, self._fetch_universes)
+
+game_metadata = GameMetadataResolver()
+
+# Username -> user ID lookups are shared by every command and remembered across restarts
+USERNAMES_URL = "https://users.roblox.com/v1/usernames/users"
+USERNAME_CACHE_FILE = "username_cache.json"
+USERNAME_BATCH_SIZE = 100
+USERNAME_BATCH_DELAY = 0.05  # seconds to wait for more lookups before sending a batch
+USERNAME_FOUND_TTL = 7 * 24 * 60 * 60  # seconds; users can rename themselves
+USERNAME_NOT_FOUND_TTL = 60 * 60  # seconds; unused names can be claimed at any time
+USERNAME_CACHE_MAX_ENTRIES = 50000
+USERNAME_CACHE_SAVE_DELAY = 30  # seconds to batch cache changes before writing them to disk
+
+class UsernameResolver:
+    """
+    Resolves Roblox usernames to user IDs.
+    Lookups made at the same time are sent together in one request, concurrent lookups of the
+    same name share one result, and both found and unused names are cached in a compact
+    on-disk index so they survive restarts.
+    """
+    def __init__(self, cache_file: str):
+        self.cache_file = cache_file
+        self._index = {}  # lowercased username -> [user_id or None, resolved_at (unix time)]
+        self._waiting = {}  # lowercased username -> future shared by every caller waiting on it
+        self._queue = []  # lowercased usernames not yet sent
+        self._uncached = set()  # queued names only throwaway lookups asked for; their results are not cached
+        self._flush_handle = None
+        self._flush_tasks = set()  # Running flushes, referenced so they are not garbage collected mid-run
+        self._save_task = None
+
+    def load(self):
+        try:
+            with open(self.cache_file, "r") as file:
+                index = json.load(file)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            log_error(e)
+            print(f"Failed to load username cache: {e}")
+            return
+        now = time.time()
+        self._index = {name: entry for name, entry in index.items() if not self._is_expired(entry, now)}
+
+    def _write(self, index):
+        temp_file = f"{self.cache_file}.tmp"
+        with open(temp_file, "w") as file:
+            json.dump(index, file, separators=(",", ":"))
+        os.replace(temp_file, self.cache_file)  # Atomic, so a crash never leaves a half-written cache
+
+    async def save(self):
+        now = time.time()
+        entries = sorted(
+            ((name, entry) for name, entry in self._index.items() if not self._is_expired(entry, now)),
+            key=lambda item: item[1][1]
+        )[-USERNAME_CACHE_MAX_ENTRIES:]  # Keep the most recently resolved names
+        self._index = dict(entries)
+        try:
+            await asyncio.to_thread(self._write, dict(self._index))
+        except Exception as e:
+            log_error(e)
+            print(f"Failed to save username cache: {e}")
+
+    def _schedule_save(self):
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._save_later())
+
+    async def _save_later(self):
+        await asyncio.sleep(USERNAME_CACHE_SAVE_DELAY)
+        await self.save()
+
+    @staticmethod
+    def _is_expired(entry, now):
+        user_id, resolved_at = entry
+        ttl = USERNAME_FOUND_TTL if user_id else USERNAME_NOT_FOUND_TTL
+        return now - resolved_at > ttl
+
+    async def resolve(self, username: str):
+        """
+        Return the user ID (as a string) for a username, or None if no user has it.
+        Raises RobloxAPIError if the lookup failed.
+        """
+        return (await self.resolve_many([username]))[username]
+
+    async def resolve_many(self, usernames, cache: bool = True) -> dict:
+        """
+        Return {username: user ID or None} for several usernames. With cache=False the names are
+        still looked up together with everyone else's, but their results are not kept in the
+        cache, for one-off lookups such as random candidate names.
+        Raises RobloxAPIError if the lookup failed.
+        """
+        results = {}
+        waiting = {}
+        now = time.time()
+
+        for username in usernames:
+            key = username.lower()
+            entry = self._index.get(key)
+            if entry is not None and not self._is_expired(entry, now):
+                results[username] = entry[0]
+                continue
+
+            future = self._waiting.get(key)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._waiting[key] = future
+                self._queue.append(key)
+                if not cache:
+                    self._uncached.add(key)
+            elif cache:
+                self._uncached.discard(key)  # Someone wants to keep this one after all
+            waiting[username] = future
+
+        if waiting:
+            self._schedule_flush()
+            for username, future in waiting.items():
+                # Shield the shared future so one cancelled caller does not fail everyone else
+                results[username] = await asyncio.shield(future)
+        return results
+
+    def _schedule_flush(self):
+        if len(self._queue) >= USERNAME_BATCH_SIZE:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(USERNAME_BATCH_DELAY, self._start_flush)
+
+    def _start_flush(self):
+        task = asyncio.create_task(self._flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def close(self):
+        """
+        Finish the lookups already sent, then save the cache.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._queue:
+            self._start_flush()
+        await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        if self._save_task is not None:
+            self._save_task.cancel()
+        await self.save()
+
+    async def _flush(self):
+        self._flush_handle = None
+        while self._queue:
+            batch = self._queue[:USERNAME_BATCH_SIZE]
+            del self._queue[:USERNAME_BATCH_SIZE]
+
+            found = None
+            error = None
+            try:
+                data = await roblox_request("POST", USERNAMES_URL, json_data={"usernames": batch, "excludeBannedUsers": False})
+                found = {
+                    str(user["requestedUsername"]).lower(): str(user["id"])
+                    for user in data.get("data", [])
+                    if "requestedUsername" in user and "id" in user
+                }
+            except RobloxAPIError as e:
+                log_error(e)
+                error = e
+            except Exception as e:
+                log_error(e)
+                error = RobloxAPIError(f"Unexpected username lookup response: {e}")
+            finally:
+                # Every caller waiting on the batch gets an answer, even if the flush was cancelled
+                self._settle(batch, found, error or RobloxAPIError("Username lookup was cancelled"))
+            if found is not None:
+                self._schedule_save()
+
+    def _settle(self, batch, found, error):
+        resolved_at = time.time()
+        for key in batch:
+            future = self._waiting.pop(key, None)
+            cache = key not in self._uncached
+            self._uncached.discard(key)
+            if found is None:
+                if future is not None and not future.done():
+                    future.set_exception(error)
+                continue
+            user_id = found.get(key)
+            if cache:
+                self._index[key] = [user_id, resolved_at]
+            if future is not None and not future.done():
+                future.set_result(user_id)
+
+username_resolver = UsernameResolver(USERNAME_CACHE_FILE)
+username_resolver.load()
+
+SOUL_CATEGORY_NAME = "Soul"
+
+class SoulChannelIndex:
+    """
+    Index from guild to its Soul category and the category's channels by name.
+    Each guild is resolved once and re-resolved only when a channel or guild event says it may
+    have changed, so looking up a notification channel (or finding out a guild has no Soul setup)
+    is a dictionary lookup instead of a scan of the guild's categories and channels.
+    """
+    def __init__(self):
+        self._guilds = {}  # guild id -> {channel name: channel}, or None when the guild has no Soul category
+
+    def rebuild(self, guild):
+        soul_category = discord.utils.get(guild.categories, name=SOUL_CATEGORY_NAME)
+        if soul_category is None:
+            if self._guilds.get(guild.id, {}) is not None:
+                print(f"⚠️ Soul category not found in guild {guild.name}. Notifications are disabled there until /setup is run.")
+            self._guilds[guild.id] = None
+        else:
+            self._guilds[guild.id] = {channel.name: channel for channel in soul_category.channels}
+
+    def remove(self, guild_id: int):
+        self._guilds.pop(guild_id, None)
+
+    def get_channel(self, guild, name: str):
+        """
+        Return the named channel in the guild's Soul category, or None.
+        """
+        if guild.id not in self._guilds:
+            self.rebuild(guild)
+        channels = self._guilds[guild.id]
+        return channels.get(name) if channels else None
+
+soul_channels = SoulChannelIndex()
+
+# Outbound notifications are grouped per channel, up to Discord's limits for a single message
+DISCORD_EMBEDS_PER_MESSAGE = 10
+DISCORD_EMBED_CHARACTERS_PER_MESSAGE = 6000
+OUTBOX_FLUSH_DELAY = 2.0  # seconds an embed may wait for more embeds headed to the same channel
+
+# Optional webhook delivery: "bot" sends as the bot, "webhook" posts through a webhook per Soul channel
+NOTIFICATION_DELIVERY_MODE = os.getenv("SOUL_DELIVERY_MODE", "bot").lower()
+WEBHOOK_CHANNEL_NAMES = {"status-updates", "updates", "changelogs", "group-updates", "game-alerts"}
+WEBHOOK_NAME = "SOUL"
+
+class WebhookDelivery:
+    """
+    Posts notifications through one bot-owned webhook per Soul channel, so busy servers use the
+    webhook's own rate limit instead of the bot's. Webhooks are looked up or created on first use
+    and recreated lazily when one turns out to have been deleted. Channels where the bot may not
+    manage webhooks fall back to regular messages.
+    """
+    def __init__(self):
+        self._webhooks = {}  # channel id -> discord.Webhook
+        self._locks = {}  # channel id -> lock held while finding or creating the channel's webhook
+        self._unsupported = set()  # channel ids where webhooks cannot be used
+
+    def handles(self, channel) -> bool:
+        return NOTIFICATION_DELIVERY_MODE == "webhook" and channel.name in WEBHOOK_CHANNEL_NAMES and channel.id not in self._unsupported
+
+    def forget(self, channel_id):
+        self._webhooks.pop(channel_id, None)
+
+    async def _get_webhook(self, channel):
+        async with self._locks.setdefault(channel.id, asyncio.Lock()):
+            webhook = self._webhooks.get(channel.id)
+            if webhook is None:
+                # Reuse a webhook the bot created earlier before making a new one
+                existing_webhooks = await channel.webhooks()
+                webhook = next((hook for hook in existing_webhooks if hook.user and hook.user.id == bot.user.id and hook.token), None)
+                if webhook is None:
+                    webhook = await channel.create_webhook(name=WEBHOOK_NAME, reason="SOUL notification delivery")
+                self._webhooks[channel.id] = webhook
+            return webhook
+
+    async def send(self, channel, embeds):
+        try:
+            for _ in range(2):
+                webhook = await self._get_webhook(channel)
+                try:
+                    await webhook.send(embeds=embeds, username=bot.user.name, avatar_url=bot.user.display_avatar.url)
+                    return
+                except discord.NotFound:
+                    self.forget(channel.id)  # Deleted since we cached it; create a new one and try again
+        except discord.Forbidden:
+            print(f"⚠️ Missing permission to manage webhooks in #{channel.name} ({channel.guild.name}). Sending as the bot instead.")
+            self._unsupported.add(channel.id)
+            self.forget(channel.id)
+        await channel.send(embeds=embeds)
+
+webhook_delivery = WebhookDelivery()
+
+class NotificationOutbox:
+    """
+    Buffers embeds per channel and sends them together, up to ten per message.
+    A channel is flushed as soon as it has a full message worth of embeds, or OUTBOX_FLUSH_DELAY
+    after its first embed was queued. Each channel has a single sender at a time, so messages to
+    the same channel never race each other for its rate limit bucket (discord.py waits out the
+    bucket when it runs dry).
+    """
+    def __init__(self):
+        self._pending = {}  # channel id -> (channel, [embeds])
+        self._timers = {}  # channel id -> flush timer
+        self._locks = {}  # channel id -> lock held while sending to the channel
+        self._flush_tasks = set()  # Running background flushes, referenced so they are not garbage collected mid-run
+        self.messages_sent = 0
+        self.embeds_sent = 0
+
+    def queue(self, channel, embed):
+        channel_embeds = self._pending.setdefault(channel.id, (channel, []))[1]
+        channel_embeds.append(embed)
+        if len(channel_embeds) >= DISCORD_EMBEDS_PER_MESSAGE:
+            self._cancel_timer(channel.id)
+            self._start_flush(channel)
+        elif channel.id not in self._timers:
+            self._timers[channel.id] = asyncio.get_running_loop().call_later(OUTBOX_FLUSH_DELAY, self._start_flush, channel)
+
+    def _start_flush(self, channel):
+        task = asyncio.create_task(self.flush(channel))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def close(self):
+        """
+        Send everything still queued and wait for the background flushes to finish.
+        """
+        await self.flush()
+        await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    def _cancel_timer(self, channel_id):
+        timer = self._timers.pop(channel_id, None)
+        if timer is not None:
+            timer.cancel()
+
+    @staticmethod
+    def _next_message(embeds) -> int:
+        # Number of embeds from the front of the buffer that fit in one message
+        count = 0
+        characters = 0
+        for embed in embeds[:DISCORD_EMBEDS_PER_MESSAGE]:
+            characters += len(embed)
+            if count and characters > DISCORD_EMBED_CHARACTERS_PER_MESSAGE:
+                break
+            count += 1
+        return count
+
+    async def flush(self, channel=None):
+        """
+        Send everything queued for a channel, or for every channel when none is given.
+        """
+        if channel is None:
+            channels = [queued_channel for queued_channel, _ in self._pending.values()]
+            await asyncio.gather(*(self.flush(queued_channel) for queued_channel in channels))
+            return
+
+        self._cancel_timer(channel.id)
+        async with self._locks.setdefault(channel.id, asyncio.Lock()):
+            while True:
+                channel_embeds = self._pending.get(channel.id, (channel, []))[1]
+                if not channel_embeds:
+                    self._pending.pop(channel.id, None)
+                    return
+
+                count = self._next_message(channel_embeds)
+                embeds = channel_embeds[:count]
+                del channel_embeds[:count]
+                try:
+                    if webhook_delivery.handles(channel):
+                        await webhook_delivery.send(channel, embeds)
+                    else:
+                        await channel.send(embeds=embeds)
+                    self.messages_sent += 1
+                    self.embeds_sent += len(embeds)
+                except asyncio.CancelledError:
+                    channel_embeds[:0] = embeds  # Not delivered; keep them for the next flush
+                    raise
+                except Exception as e:
+                    log_error(e)
+                    print(f"⚠️ Failed to send {len(embeds)} embeds to #{channel.name} in {channel.guild.name}: {e}")
+
+notification_outbox = NotificationOutbox()
+
+# Pollers publish what they found as events; consumer tasks render and deliver them, so a slow
+# Discord send never holds up Roblox polling (and the other way round)
+StatusChanged = namedtuple("StatusChanged", "user_id statuses")  # {channel: status} for every channel a user's change is headed to
+GameJoined = namedtuple("GameJoined", "user_id presence")
+PriceChanged = namedtuple("PriceChanged", "guild_id item_id last_price current_price")
+GroupChanged = namedtuple("GroupChanged", "monitor changes left_usernames")  # Joins, leaves and a new shout from one poll
+VersionChanged = namedtuple("VersionChanged", "previous_version current_version")
+
+EVENT_BATCH_SIZE = 100  # Most events a consumer takes from its queue at once
+
+class EventQueue:
+    """
+    Bounded queue of one event type. Events with a merge key replace the queued event with the
+    same key (keeping its place in line) instead of queueing behind it; once the queue is full,
+    the oldest event is dropped to make room, and handed to on_drop if given. Counts what
+    happened to every event so backpressure can be reported.
+    """
+    def __init__(self, name: str, maxsize: int, key=None, merge=None, on_drop=None):
+        self.name = name
+        self.maxsize = maxsize
+        self.key = key
+        self.merge = merge or (lambda queued, newer: newer)
+        self.on_drop = on_drop
+        self._events = OrderedDict()  # merge key (or sequence number) -> (queued_at, event), oldest first
+        self._sequence = 0
+        self._ready = None  # Created by bind(), inside the running event loop
+        self.in_flight = []  # The batch the consumer is handling right now
+        self.published = 0
+        self.merged = 0
+        self.dropped = 0
+        self.delivered = 0
+        self.failed = 0
+        self.high_water = 0
+
+    def bind(self):
+        self._ready = asyncio.Event()
+        if self._events:
+            self._ready.set()
+
+    def put(self, event):
+        self.published += 1
+        if self.key is None:
+            self._sequence += 1
+            key = self._sequence
+        else:
+            key = self.key(event)
+            if key in self._events:
+                queued_at, queued_event = self._events[key]
+                self._events[key] = (queued_at, self.merge(queued_event, event))
+                self.merged += 1
+                return
+
+        if len(self._events) >= self.maxsize:
+            _, (_, dropped_event) = self._events.popitem(last=False)
+            self.dropped += 1  # Reported through stats(), not per event, since drops come in bursts
+            if self.on_drop is not None:
+                self.on_drop(dropped_event)
+        self._events[key] = (time.monotonic(), event)
+        self.high_water = max(self.high_water, len(self._events))
+        if self._ready is not None:
+            self._ready.set()
+
+    def backlog(self) -> int:
+        return len(self._events) + len(self.in_flight)
+
+    async def get_batch(self, limit: int) -> list:
+        while not self._events:
+            self._ready.clear()
+            await self._ready.wait()
+        batch = []
+        while self._events and len(batch) < limit:
+            batch.append(self._events.popitem(last=False)[1][1])
+        return batch
+
+    def stats(self) -> dict:
+        oldest = next(iter(self._events.values()), None)
+        return {
+            "queued": len(self._events),
+            "high_water": self.high_water,
+            "published": self.published,
+            "merged": self.merged,
+            "dropped": self.dropped,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "oldest_age": round(time.monotonic() - oldest[0], 1) if oldest else 0.0
+        }
+
+class EventBus:
+    """
+    Routes each event type to its own bounded EventQueue and consumer task. publish() never
+    waits, so producers are never slowed down by consumers that have fallen behind; the queue's
+    merge and drop policy absorbs the difference instead.
+    """
+    def __init__(self):
+        self._queues = {}  # event type -> EventQueue
+        self._handlers = {}  # event type -> async handler taking a list of events
+        self._consumers = []
+
+    def subscribe(self, event_type, handler, *, maxsize: int, key=None, merge=None, on_drop=None):
+        self._queues[event_type] = EventQueue(event_type.__name__, maxsize, key, merge, on_drop)
+        self._handlers[event_type] = handler
+
+    def publish(self, event):
+        self._queues[type(event)].put(event)
+
+    async def _consume(self, queue: EventQueue, handler):
+        while True:
+            events = await queue.get_batch(EVENT_BATCH_SIZE)
+            queue.in_flight = events  # Left in place if the consumer is cancelled mid-batch
+            try:
+                await handler(events)
+                queue.delivered += len(events)
+            except Exception as e:
+                queue.failed += len(events)
+                log_error(e)
+                print(f"⚠️ Failed to handle {len(events)} {queue.name} events: {e}")
+            queue.in_flight = []
+
+    async def drain(self, timeout: float) -> bool:
+        """
+        Wait up to `timeout` seconds for the consumers to handle everything queued.
+        Returns whether every queue was emptied.
+        """
+        deadline = time.monotonic() + timeout
+        while self._consumers and any(queue.backlog() for queue in self._queues.values()):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.1)
+        return not any(queue.backlog() for queue in self._queues.values())
+
+    def pending(self, event_type) -> list:
+        """
+        Events of a type that have not been handled yet, including a batch interrupted by stop().
+        """
+        queue = self._queues[event_type]
+        return queue.in_flight + [event for _, event in queue._events.values()]
+
+    def start(self):
+        if self._consumers:
+            return
+        for event_type, queue in self._queues.items():
+            queue.bind()
+            self._consumers.append(asyncio.create_task(self._consume(queue, self._handlers[event_type])))
+
+    async def stop(self):
+        for consumer in self._consumers:
+            consumer.cancel()
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+        self._consumers.clear()
+
+    def stats(self) -> dict:
+        return {queue.name: queue.stats() for queue in self._queues.values()}
+
+event_bus = EventBus()
+
 def get_file_hash(file_path):
     """
     Calculate the hash of a file to detect changes.
@@ -257,14 +2017,8 @@ async def check_and_send_changelog():
 
             # Send the changelog to the `changelogs` channel in each server
             for guild in bot.guilds:
-                soul_category = discord.utils.get(guild.categories, name="Soul")
-                if not soul_category:
-                    print(f"⚠️ Soul category not found in guild {guild.name}. Skipping...")
-                    continue
-
-                changelog_channel = discord.utils.get(soul_category.channels, name="changelogs")
+                changelog_channel = soul_channels.get_channel(guild, "changelogs")
                 if not changelog_channel:
-                    print(f"⚠️ Changelogs channel not found in guild {guild.name}. Skipping...")
                     continue
 
                 # Create an embed for the changelog
@@ -275,13 +2029,11 @@ async def check_and_send_changelog():
                 )
                 embed.set_footer(text="Stay updated with SOUL Bot!")
 
-                # Send the embed
-                try:
-                    await changelog_channel.send(embed=embed)
-                    print(f"✅ Changelog sent to {guild.name} in {changelog_channel.name}.")
-                except Exception as e:
-                    log_error(e)
-                    print(f"⚠️ Failed to send changelog to {guild.name}: {e}")
+                # Queue the embed; the outbox sends it together with anything else bound for the channel
+                notification_outbox.queue(changelog_channel, embed)
+                print(f"✅ Changelog queued for {guild.name} in {changelog_channel.name}.")
+
+            await notification_outbox.flush()
 
         # Save the new hash
         with open(last_changelog_file, "w") as file:
@@ -315,45 +2067,529 @@ async def check_roblox_updates():
     Periodically check for Roblox updates and send an embed if a new version is detected.
     """
     last_version = load_last_version()
-    current_version = fetch_roblox_version()
+    current_version = await fetch_roblox_version()
+
+    if not current_version:
+        print("Failed to fetch the current Roblox version.")
+        return
+
+    if last_version != current_version:
+        # Save the new version
+        save_last_version(current_version)
+        event_bus.publish(VersionChanged(last_version, current_version))
+
+async def announce_version_changes(events):
+    """
+    Send a Roblox update notification to every server with an Updates channel.
+    """
+    for event in events:
+        # Create an embed for the update
+        embed = discord.Embed(
+            title="Roblox Update Detected!",
+            description=f"Roblox has been updated to version: **{event.current_version}**",
+            color=discord.Color.green()
+        )
+        embed.add_field(name="Previous Version", value=event.previous_version if event.previous_version else "Unknown", inline=False)
+        embed.add_field(name="New Version", value=event.current_version, inline=False)
+        embed.set_footer(text="Stay updated with SOUL Bot!")
+
+        # Send the embed to all servers with a specific channel
+        for guild in bot.guilds:
+            updates_channel = soul_channels.get_channel(guild, "updates")
+            if updates_channel:
+                notification_outbox.queue(updates_channel, embed)
+                print(f"Update notification queued for {guild.name} in {updates_channel.name}.")
+
+    await notification_outbox.flush()
+
+# Several updates before the consumer catches up are announced as one, from the oldest to the newest version
+event_bus.subscribe(
+    VersionChanged, announce_version_changes, maxsize=10,
+    key=lambda event: "version",
+    merge=lambda queued, newer: queued._replace(current_version=newer.current_version)
+)
+
+GROUP_MEMBERS_PAGE_SIZE = 100
+GROUP_TICK_SECONDS = 60  # How often check_group_updates looks for groups that are due
+GROUP_POLL_FLOOR = 2 * 60  # seconds between polls of a group whose membership or shout just changed
+GROUP_POLL_CEILING = 60 * 60  # seconds between polls of a group that has been quiet for a long time
+GROUP_POLL_BACKOFF = 1.5  # Interval multiplier after each poll without a change
+GROUP_POLL_CONCURRENCY = 3  # Groups polled at once
+GROUP_JOIN_SCAN_PAGES = 5  # Newest-first member pages walked per poll looking for joins
+GROUP_SCAN_PAGES_PER_POLL = 20  # Member pages a full scan may walk per poll; the rest of the scan resumes on later polls
+GROUP_FULL_SCAN_INTERVAL = 6 * 60 * 60  # seconds between full member scans, which are what find leaves
+GROUP_LEAVE_SCAN_INTERVAL = 60 * 60  # seconds; a full scan starts this soon after the last one when members seem to have left
+GROUP_CHANGES_LISTED = 20  # Members named per join/leave notification
+
+async def fetch_group_details(group_id: int) -> dict:
+    """
+    Fetch a group's details (name, owner, member count, shout...) from groups.roblox.com.
+    """
+    return await roblox_request("GET", f"https://groups.roblox.com/v1/groups/{group_id}")
+
+async def get_usernames(user_ids) -> dict:
+    """
+    Look up the usernames of up to 100 user IDs with one request. Returns user ID -> username.
+    """
+    user_ids = [int(user_id) for user_id in user_ids][:100]
+    if not user_ids:
+        return {}
+    data = await roblox_request("POST", "https://users.roblox.com/v1/users", json_data={"userIds": user_ids, "excludeBannedUsers": False})
+    return {user["id"]: user.get("name", "Unknown") for user in data.get("data", [])}
+
+class GroupMonitor:
+    """
+    Watches a Roblox group for member joins and leaves and for new shouts.
+    Membership is kept as a sorted array of 64-bit user IDs. Joins are found on every poll by
+    walking the member list newest first until a known member turns up, which usually costs a
+    single page. Leaves can only be found by walking the whole list, so full scans run every
+    GROUP_FULL_SCAN_INTERVAL (or GROUP_LEAVE_SCAN_INTERVAL when the member count suggests someone
+    left), GROUP_SCAN_PAGES_PER_POLL pages at a time, with a bitmap marking which known members
+    are still there. The shout is only processed when its "updated" marker changes.
+
+    Each group also has its own poll interval: it drops to GROUP_POLL_FLOOR after a change and
+    grows by GROUP_POLL_BACKOFF after each quiet poll, up to GROUP_POLL_CEILING. While a full scan
+    is under way, the group is polled again on the next tick so the scan keeps moving.
+    """
+    def __init__(self, group_id: int):
+        self.group_id = group_id
+        self.name = None
+        self.members = None  # Sorted array("q") of user IDs; None until the first full scan has finished
+        self.member_count = None
+        self.shout_marker = None
+        self.last_full_scan = 0.0  # When the last full scan finished
+        self.leaves_suspected = False
+        self._scan = None  # State of the full scan in progress, if any
+        self.interval = GROUP_POLL_FLOOR
+        self.next_poll = 0.0  # Due immediately
+
+    def is_due(self, now: float) -> bool:
+        return now >= self.next_poll
+
+    def reschedule(self, changed: bool):
+        if changed:
+            self.interval = GROUP_POLL_FLOOR
+        else:
+            self.interval = min(GROUP_POLL_CEILING, self.interval * GROUP_POLL_BACKOFF)
+        delay = GROUP_TICK_SECONDS if self._scan is not None else self.interval
+        self.next_poll = time.monotonic() + delay
+
+    def is_member(self, user_id: int) -> bool:
+        position = bisect.bisect_left(self.members, user_id)
+        return position < len(self.members) and self.members[position] == user_id
+
+    def add_members(self, user_ids):
+        # A copy, so the snapshot a running full scan compares against is left untouched
+        members = array("q", self.members)
+        for user_id in user_ids:
+            if not self.is_member(user_id):
+                bisect.insort(members, user_id)
+        self.members = members
+
+    async def fetch_members_page(self, sort_order: str, cursor=None):
+        """
+        Fetch one page of the member list. Returns (users, next page cursor).
+        """
+        params = {"limit": GROUP_MEMBERS_PAGE_SIZE, "sortOrder": sort_order}
+        if cursor:
+            params["cursor"] = cursor
+        page = await roblox_request("GET", f"https://groups.roblox.com/v1/groups/{self.group_id}/users", params=params)
+        users = [membership.get("user", {}) for membership in page.get("data", [])]
+        return [user for user in users if "userId" in user], page.get("nextPageCursor")
+
+    async def find_new_members(self) -> list:
+        """
+        Walk the member list newest first and return the members that joined since the last poll.
+        Joins beyond GROUP_JOIN_SCAN_PAGES pages are left to the next full scan.
+        """
+        joined = []
+        cursor = None
+        for _ in range(GROUP_JOIN_SCAN_PAGES):
+            users, cursor = await self.fetch_members_page("Desc", cursor)
+            for user in users:
+                if self.is_member(int(user["userId"])):
+                    return joined
+                joined.append(user)
+            if not cursor:
+                break
+        return joined
+
+    async def continue_full_scan(self):
+        """
+        Walk up to GROUP_SCAN_PAGES_PER_POLL more pages of the full scan. Returns None while the scan
+        is unfinished, then (missed joins, listed leaves, total leaves) once it is done.
+        """
+        scan = self._scan
+        if scan is None:
+            baseline = self.members
+            scan = self._scan = {
+                "cursor": None,
+                "baseline": baseline,  # The membership being checked; never modified during the scan
+                "seen": bytearray(len(baseline)) if baseline is not None else None,
+                "collected": array("q") if baseline is None else None,
+                "joined": []
+            }
+
+        baseline = scan["baseline"]
+        for _ in range(GROUP_SCAN_PAGES_PER_POLL):
+            users, scan["cursor"] = await self.fetch_members_page("Asc", scan["cursor"])
+            for user in users:
+                user_id = int(user["userId"])
+                if baseline is None:
+                    scan["collected"].append(user_id)
+                    continue
+                position = bisect.bisect_left(baseline, user_id)
+                if position < len(baseline) and baseline[position] == user_id:
+                    scan["seen"][position] = 1
+                elif not self.is_member(user_id):
+                    scan["joined"].append(user)  # Joined too far back for find_new_members to reach
+            if not scan["cursor"]:
+                break
+        if scan["cursor"]:
+            return None
+
+        self._scan = None
+        self.last_full_scan = time.monotonic()
+        self.leaves_suspected = False
+        if baseline is None:
+            self.members = array("q", sorted(scan["collected"]))  # Sorted once, for the very first snapshot
+            return [], [], 0
+
+        seen = scan["seen"]
+        left_total = seen.count(0)
+        left = []
+        if left_total:
+            for position, user_id in enumerate(baseline):
+                if not seen[position]:
+                    left.append(user_id)
+                    if len(left) >= GROUP_CHANGES_LISTED:
+                        break
+
+            def has_left(user_id):
+                position = bisect.bisect_left(baseline, user_id)
+                return position < len(baseline) and baseline[position] == user_id and not seen[position]
+
+            self.members = array("q", (user_id for user_id in self.members if not has_left(user_id)))
+        return scan["joined"], left, left_total
+
+    def full_scan_due(self, now: float) -> bool:
+        if self._scan is not None or self.members is None:
+            return True
+        since_last_scan = now - self.last_full_scan
+        return since_last_scan >= GROUP_FULL_SCAN_INTERVAL or (self.leaves_suspected and since_last_scan >= GROUP_LEAVE_SCAN_INTERVAL)
+
+    async def poll(self):
+        """
+        Check the group once. Returns the changes since the previous poll, or None while the first
+        full scan is still recording the baseline. The poll that finishes the baseline returns no
+        changes, only "baseline_recorded" set to True.
+        """
+        details = await fetch_group_details(self.group_id)
+        self.name = details.get("name", self.name)
+        changes = {"joined": [], "joined_total": 0, "left": [], "left_total": 0, "shout": None, "baseline_recorded": False}
+        first_poll = self.members is None
+        joined_users = []
+
+        member_count = details.get("memberCount")
+        if not first_poll:
+            joined_users = await self.find_new_members()
+            self.add_members(int(user["userId"]) for user in joined_users)
+            # Fewer new members than the count grew by means someone left as well
+            if member_count is not None and self.member_count is not None and member_count - self.member_count < len(joined_users):
+                self.leaves_suspected = True
+        self.member_count = member_count
+
+        if self.full_scan_due(time.monotonic()):
+            scan_result = await self.continue_full_scan()
+            if scan_result is not None:
+                missed_joins, changes["left"], changes["left_total"] = scan_result
+                self.add_members(int(user["userId"]) for user in missed_joins)
+                joined_users += missed_joins
+
+        changes["joined_total"] = len(joined_users)
+        changes["joined"] = [(int(user["userId"]), user.get("username", "Unknown")) for user in joined_users[:GROUP_CHANGES_LISTED]]
+
+        shout = details.get("shout") or {}
+        shout_marker = shout.get("updated")
+        if shout_marker != self.shout_marker:
+            self.shout_marker = shout_marker
+            if shout.get("body"):
+                changes["shout"] = shout
+
+        changed = bool(changes["joined_total"] or changes["left_total"] or changes["shout"])
+        self.reschedule(changed)
+        if first_poll:
+            if self.members is None:
+                return None
+            return {"joined": [], "joined_total": 0, "left": [], "left_total": 0, "shout": None, "baseline_recorded": True}
+        return changes
+
+def build_group_change_embeds(monitor: GroupMonitor, changes: dict, left_usernames: dict) -> list:
+    group_link = f"[{monitor.name or monitor.group_id}](https://www.roblox.com/groups/{monitor.group_id})"
+    embeds = []
+
+    if changes["joined_total"]:
+        lines = [f"{username} (`{user_id}`)" for user_id, username in changes["joined"]]
+        if changes["joined_total"] > len(lines):
+            lines.append(f"...and {changes['joined_total'] - len(lines)} more")
+        embed = discord.Embed(title="Group Members Joined", description=f"{group_link}\n\n" + "\n".join(lines), color=discord.Color.green())
+        embed.set_footer(text=f"Members: {monitor.member_count}")
+        embeds.append(embed)
+
+    if changes["left_total"]:
+        lines = [f"{left_usernames.get(user_id, 'Unknown')} (`{user_id}`)" for user_id in changes["left"]]
+        if changes["left_total"] > len(lines):
+            lines.append(f"...and {changes['left_total'] - len(lines)} more")
+        embed = discord.Embed(title="Group Members Left", description=f"{group_link}\n\n" + "\n".join(lines), color=discord.Color.red())
+        embed.set_footer(text=f"Members: {monitor.member_count}")
+        embeds.append(embed)
+
+    if changes["shout"]:
+        shout = changes["shout"]
+        poster = (shout.get("poster") or {}).get("username", "Unknown")
+        embed = discord.Embed(title="New Group Shout", description=f"{group_link}\n\n{shout['body'][:3500]}", color=discord.Color.blue())
+        embed.add_field(name="Posted By", value=poster, inline=False)
+        embeds.append(embed)
+
+    return embeds
+
+class GroupWatchRegistry:
+    """
+    The Roblox groups each guild monitors. Every group has a single GroupMonitor however many
+    guilds watch it, so it is fetched once and its changes are fanned out to all of them.
+    GROUP_ID is watched by every guild with a Group Updates channel.
+    """
+    def __init__(self, guild_group_ids: dict):
+        self.guild_group_ids = guild_group_ids  # guild_id -> [group_id]
+        self.group_guild_ids = {}  # group_id -> set of guild_ids
+        self.monitors = {GROUP_ID: GroupMonitor(GROUP_ID)}
+        self.poll_tasks = {}  # group_id -> task polling the group right now
+        self._poll_semaphore = None  # Created on first use, inside the running event loop
+        for guild_id, group_ids in guild_group_ids.items():
+            for group_id in group_ids:
+                self._index(guild_id, group_id)
+
+    def _index(self, guild_id: str, group_id: int):
+        self.group_guild_ids.setdefault(group_id, set()).add(guild_id)
+        if group_id not in self.monitors:
+            self.monitors[group_id] = GroupMonitor(group_id)
+
+    def is_watching(self, guild_id: str, group_id: int) -> bool:
+        return guild_id in self.group_guild_ids.get(group_id, ())
+
+    async def add(self, guild_id: str, group_id: int):
+        self.guild_group_ids.setdefault(guild_id, []).append(group_id)
+        self._index(guild_id, group_id)
+        await soul_store.add_group_watch(guild_id, group_id)
+
+    async def remove(self, guild_id: str, group_id: int):
+        if group_id in self.guild_group_ids.get(guild_id, []):
+            self.guild_group_ids[guild_id].remove(group_id)
+        watchers = self.group_guild_ids.get(group_id, set())
+        watchers.discard(guild_id)
+        if not watchers:
+            self.group_guild_ids.pop(group_id, None)
+            if group_id != GROUP_ID:
+                self.monitors.pop(group_id, None)  # Nobody watches it anymore; stop polling
+        await soul_store.remove_group_watch(guild_id, group_id)
+
+    def guilds_for(self, group_id: int):
+        if group_id == GROUP_ID:
+            return [guild for guild in bot.guilds]
+        return [guild for guild in (bot.get_guild(int(guild_id)) for guild_id in self.group_guild_ids.get(group_id, ())) if guild]
+
+    def due_monitors(self) -> list:
+        now = time.monotonic()
+        return [monitor for monitor in self.monitors.values() if monitor.is_due(now)]
+
+    def start_due_polls(self, poll) -> int:
+        """
+        Start poll(monitor, semaphore) as its own task for every due group that is not already being
+        polled. Returns the number of polls started.
+        """
+        if self._poll_semaphore is None:
+            self._poll_semaphore = asyncio.Semaphore(GROUP_POLL_CONCURRENCY)
+        started = 0
+        for monitor in self.due_monitors():
+            if monitor.group_id in self.poll_tasks:
+                continue  # Still busy with its previous poll
+            task = asyncio.create_task(poll(monitor, self._poll_semaphore))
+            self.poll_tasks[monitor.group_id] = task
+            task.add_done_callback(lambda finished_task, group_id=monitor.group_id: self._poll_finished(group_id, finished_task))
+            started += 1
+        return started
+
+    def _poll_finished(self, group_id: int, task: asyncio.Task):
+        if self.poll_tasks.get(group_id) is task:
+            del self.poll_tasks[group_id]
+        if not task.cancelled() and task.exception() is not None:
+            log_error(task.exception())
+            print(f"⚠️ Polling group {group_id} failed: {task.exception()}")
+
+    async def cancel_polls(self):
+        tasks_running = list(self.poll_tasks.values())
+        for task in tasks_running:
+            task.cancel()
+        await asyncio.gather(*tasks_running, return_exceptions=True)
+
+group_watches = GroupWatchRegistry(soul_store.load_group_watches())
+
+async def poll_group(monitor: GroupMonitor, semaphore: asyncio.Semaphore):
+    """
+    Poll one group and publish a GroupChanged event when its members or shout changed.
+    """
+    async with semaphore:
+        try:
+            changes = await monitor.poll()
+        except RobloxAPIError as e:
+            log_error(e)
+            print(f"Failed to check group {monitor.group_id}: {e}")
+            monitor.reschedule(changed=False)
+            return
+        if changes is None:
+            return  # The first full scan is still under way; it carries on next tick
+        if changes["baseline_recorded"]:
+            print(f"Group {monitor.group_id} baseline recorded: {len(monitor.members)} members.")
+            return
+        if not (changes["joined_total"] or changes["left_total"] or changes["shout"]):
+            return
+
+        left_usernames = {}
+        if changes["left"]:
+            try:
+                left_usernames = await get_usernames(changes["left"])
+            except RobloxAPIError as e:
+                log_error(e)
+    event_bus.publish(GroupChanged(monitor, changes, left_usernames))
+
+async def deliver_group_changes(events):
+    """
+    Post each group's changes to the Group Updates channel of every server watching it.
+    """
+    for event in events:
+        embeds = build_group_change_embeds(event.monitor, event.changes, event.left_usernames)
+        for guild in group_watches.guilds_for(event.monitor.group_id):
+            group_channel = soul_channels.get_channel(guild, "group-updates")
+            if group_channel:
+                for embed in embeds:
+                    notification_outbox.queue(group_channel, embed)
+    await notification_outbox.flush()
+
+event_bus.subscribe(GroupChanged, deliver_group_changes, maxsize=200)
+
+@tasks.loop(seconds=GROUP_TICK_SECONDS)
+async def check_group_updates():
+    """
+    Start a poll of every monitored group that is due. Each group is polled in its own task, so a
+    long member scan of one group never holds up the others, and a group still being polled is
+    skipped until its poll finishes.
+    """
+    group_watches.start_due_polls(poll_group)
+
+ITEM_PRICE_CONCURRENCY = 5  # Maximum resale-data requests in flight at once
+
+async def fetch_item_price(item_id: int, semaphore: asyncio.Semaphore):
+    """
+    Fetch the recent average price of a limited item, holding the semaphore for the request.
+    """
+    resale_url = f"https://economy.roblox.com/v1/assets/{item_id}/resale-data"
+    async with semaphore:
+        resale_data = await roblox_request("GET", resale_url)
+    return resale_data.get("recentAveragePrice", None)
+
+def queue_item_price_update(guild_id: str, item_id: int, last_price, current_price):
+    """
+    Queue a price change notification for a server's Status Updates channel.
+    """
+    guild = bot.get_guild(int(guild_id))
+    if not guild:
+        return
+
+    status_channel = soul_channels.get_channel(guild, "status-updates")
+    if not status_channel:
+        return
+
+    embed_color = discord.Color.blue()
+    if isinstance(last_price, int) and isinstance(current_price, int):
+        embed_color = discord.Color.green() if current_price > last_price else discord.Color.red()
+
+    embed = discord.Embed(
+        title="Item Price Update",
+        description=f"[View Item](https://www.roblox.com/catalog/{item_id})",
+        color=embed_color
+    )
+    embed.add_field(name="Item ID", value=item_id, inline=False)
+    embed.add_field(name="Previous Price", value=f"{last_price} Robux" if last_price is not None else "N/A", inline=False)
+    embed.add_field(name="Current Price", value=f"{current_price} Robux" if current_price is not None else "N/A", inline=False)
+    embed.set_footer(text="Stay updated with SOUL Bot!")
 
-    if not current_version:
-        print("Failed to fetch the current Roblox version.")
-        return
+    notification_outbox.queue(status_channel, embed)
 
-    if last_version != current_version:
-        # Save the new version
-        save_last_version(current_version)
+async def deliver_price_changes(events):
+    for event in events:
+        queue_item_price_update(event.guild_id, event.item_id, event.last_price, event.current_price)
+    await notification_outbox.flush()
 
-        # Create an embed for the update
-        embed = discord.Embed(
-            title="Roblox Update Detected!",
-            description=f"Roblox has been updated to version: **{current_version}**",
-            color=discord.Color.green()
-        )
-        embed.add_field(name="Previous Version", value=last_version if last_version else "Unknown", inline=False)
-        embed.add_field(name="New Version", value=current_version, inline=False)
-        embed.set_footer(text="Stay updated with SOUL Bot!")
+# A price that changes again before it is announced is reported once, from the first price to the latest
+event_bus.subscribe(
+    PriceChanged, deliver_price_changes, maxsize=1000,
+    key=lambda event: (event.guild_id, event.item_id),
+    merge=lambda queued, newer: queued._replace(current_price=newer.current_price)
+)
 
-        # Send the embed to all servers with a specific channel
-        for guild in bot.guilds:
-            soul_category = discord.utils.get(guild.categories, name="Soul")
-            if not soul_category:
+@tasks.loop(minutes=10)  # Adjust the interval as needed
+async def check_item_prices():
+    """
+    Poll the price of every tracked item once per tick, no matter how many servers track it,
+    and notify each tracking server when the price changes.
+    """
+    print("Checking item prices...")
+
+    # Group the servers by the items they track
+    item_guild_ids = {}
+    for guild_id, items in server_item_ids.items():
+        for item_id in items:
+            item_guild_ids.setdefault(item_id, []).append(guild_id)
+
+    item_ids = list(item_guild_ids)
+    semaphore = asyncio.Semaphore(ITEM_PRICE_CONCURRENCY)
+    results = await asyncio.gather(*(fetch_item_price(item_id, semaphore) for item_id in item_ids), return_exceptions=True)
+
+    observed_prices = {}  # item_id -> price seen this tick, written to the price history
+    for item_id, current_price in zip(item_ids, results):
+        if isinstance(current_price, Exception):
+            log_error(current_price)
+            print(f"Failed to fetch price for item {item_id}: {current_price}")
+            continue
+        observed_prices[item_id] = current_price
+
+        # Fan the new price out to every server tracking the item
+        for guild_id in item_guild_ids[item_id]:
+            item_data = server_item_ids.get(guild_id, {}).get(item_id)
+            if item_data is None:
                 continue
+            last_price = item_data.get("last_price", None)
 
-            updates_channel = discord.utils.get(soul_category.channels, name="updates")
-            if updates_channel:
-                try:
-                    await updates_channel.send(embed=embed)
-                    print(f"Update notification sent to {guild.name} in {updates_channel.name}.")
-                except Exception as e:
-                    log_error(e)
-                    print(f"Failed to send update notification to {guild.name}: {e}")
+            # If the price has changed, update and notify
+            if current_price != last_price:
+                item_data["last_price"] = current_price
+                print(f"Price for item {item_id} updated in guild {guild_id}: {last_price} -> {current_price}")
+                event_bus.publish(PriceChanged(guild_id, item_id, last_price, current_price))
+
+    try:
+        await soul_store.record_item_prices(observed_prices)
+    except Exception as e:
+        log_error(e)
+        print(f"Failed to record item prices: {e}")
 
 @bot.event
 async def on_ready():
     print(f"Bot connected as {bot.user}")
 
+    # Resolve every guild's Soul channels once; channel and guild events keep the index current
+    for guild in bot.guilds:
+        soul_channels.rebuild(guild)
+
     # Start the Roblox update check task
     check_roblox_updates.start()
 
@@ -369,33 +2605,20 @@ async def on_ready():
     check_status.start()
 
     # Start the price checking task
-    @tasks.loop(minutes=10)  # Adjust the interval as needed
-    async def check_item_prices():
-        # Add your logic for checking item prices here
-        print("Checking item prices...")
-    
-        # Example logic: Iterate through tracked items and fetch their prices
-        for guild_id, items in server_item_ids.items():
-            for item_id, item_data in items.items():
-                resale_url = f"https://economy.roblox.com/v1/assets/{item_id}/resale-data"
-                try:
-                    response = requests.get(resale_url)
-                    response.raise_for_status()
-                    resale_data = response.json()
-    
-                    # Get the current price
-                    current_price = resale_data.get("recentAveragePrice", None)
-                    last_price = item_data.get("last_price", None)
-    
-                    # If the price has changed, update and notify
-                    if current_price != last_price:
-                        item_data["last_price"] = current_price
-                        print(f"Price for item {item_id} updated: {last_price} -> {current_price}")
-                except Exception as e:
-                    log_error(e)
-                    print(f"Failed to fetch price for item {item_id}: {e}")
-    
-    check_item_prices.start()
+    if not check_item_prices.is_running():
+        check_item_prices.start()
+
+    # Start the group monitoring task
+    if not check_group_updates.is_running():
+        check_group_updates.start()
+
+    # Start saving the presence snapshot
+    if not presence_snapshot_task.is_running():
+        presence_snapshot_task.start()
+
+    # Start printing the presence pipeline's stats
+    if not log_presence_stats.is_running():
+        log_presence_stats.start()
 
     try:
         synced = await tree.sync()  # Sync slash commands with Discord
@@ -423,6 +2646,12 @@ async def on_application_command_error(interaction: discord.Interaction, error):
         embed.add_field(name="/gen", value="Generate a username or random string.\nUsage: `/gen` with options 1 or 2.", inline=False)
         embed.add_field(name="/item", value="Fetch details about a Roblox limited item by its ID.\nUsage: `/item <item_id>`", inline=False)
         embed.add_field(name="/trackitem", value="Track a Roblox limited item by its ID.\nUsage: `/trackitem <item_id>`", inline=False)
+        embed.add_field(name="/watchgroup", value="Post a Roblox group's joins, leaves and shouts in this server.\nUsage: `/watchgroup <group_id>`", inline=False)
+        embed.add_field(name="/unwatchgroup", value="Stop monitoring a Roblox group in this server.\nUsage: `/unwatchgroup <group_id>`", inline=False)
+        embed.add_field(name="/watchplace", value="Get an alert when a tracked user joins a Roblox game.\nUsage: `/watchplace <place_id>`", inline=False)
+        embed.add_field(name="/unwatchplace", value="Stop game alerts for a Roblox place.\nUsage: `/unwatchplace <place_id>`", inline=False)
+        embed.add_field(name="/subscribe", value="Only announce chosen statuses of a tracked Roblox user.\nUsage: `/subscribe <user> <status>`", inline=False)
+        embed.add_field(name="/unsubscribe", value="Stop announcing a status of a tracked Roblox user.\nUsage: `/unsubscribe <user> <status>`", inline=False)
         embed.add_field(name="/setup", value="Set up the bot's categories and channels.\nUsage: `/setup`", inline=False)
         embed.add_field(name="/unsetup", value="Remove the bot's categories and channels.\nUsage: `/unsetup`", inline=False)
         embed.add_field(name="/support", value="Show this help message.\nUsage: `/support`", inline=False)
@@ -439,10 +2668,182 @@ async def on_application_command_error(interaction: discord.Interaction, error):
             ephemeral=True
         )
 
-@tasks.loop(seconds=30)
+PRESENCE_WORKERS = 4  # Presence batches and status deliveries in flight at once
+PRESENCE_TICK_DEADLINE = PRESENCE_TICK_SECONDS * 0.8  # seconds a check_status tick may run before leftover polls are carried over
+PRESENCE_SNAPSHOT_MINUTES = 5  # How often the last announced statuses are saved for the next start
+PRESENCE_STATS_SECONDS = 60  # How often the presence pipeline's stats are printed
+PRESENCE_STATS_VERBOSE = os.getenv("SOUL_DEBUG_STATS", "").lower() in ("1", "true", "yes")  # Also print every component's full stats
+
+presence_tick_stats = {"ticks": 0, "polled": 0}  # Totals since the stats were last printed
+STATUS_EVENT_QUEUE_SIZE = 5000  # Status changes waiting to be announced, at most one per user
+
+game_alert_stats = {"joins": 0, "alerts": 0}  # Totals since the bot started
+
+async def poll_presence_batch(user_ids, semaphore):
+    async with semaphore:
+        return await get_roblox_presence_details_batch(user_ids)
+
+def detect_game_joins(presences: dict) -> list:
+    """
+    Compare each polled user's game with the one seen on their previous poll and return
+    (user_id, presence) for users who have just joined a game. A user's first poll only
+    records where they are, so restarts do not alert on everyone already playing.
+    """
+    game_joins = []
+    for user_id, presence in presences.items():
+        record = presence_states.get(user_id)  # Untracked users have no record, and nothing to remember
+        if record is None or presence["status"] == "Unknown":
+            continue
+        location = (presence["place_id"], presence["game_id"]) if presence["status"] == "In Game" else None
+        previous_location = record.location
+        record.location = location
+        # The place is hidden unless the user's privacy settings let the bot's account see it
+        if previous_location != UNSEEN_LOCATION and location and location[0] and location != previous_location:
+            game_joins.append((user_id, presence))
+    return game_joins
+
+def build_game_alert_embed(user_id, presence, user_details, place, universe, avatar_url):
+    """
+    Build the embed announcing that a tracked user joined a watched game.
+    """
+    game_name = (universe or {}).get("name") or (place or {}).get("name") or presence["last_location"] or "Unknown Game"
+    embed = discord.Embed(
+        title="Game Alert",
+        description=f"**{user_details['username']}** joined **{game_name}**",
+        url=f"https://www.roblox.com/games/{presence['place_id']}",
+        color=discord.Color.green()
+    )
+    if place and place.get("name") and place["name"] != game_name:
+        embed.add_field(name="Place", value=place["name"], inline=False)
+    embed.add_field(name="PLACE ID", value=presence["place_id"], inline=False)
+    if universe and universe.get("playing") is not None:
+        embed.add_field(name="Playing", value=f"{universe['playing']:,}", inline=False)
+    embed.add_field(name="USER ID", value=user_id, inline=False)
+    if avatar_url:
+        embed.set_thumbnail(url=avatar_url)
+    return embed
+
+async def deliver_game_alerts(events):
+    """
+    Alert every server that tracks a user who just joined one of its watched places. Watching a
+    place also matches the other places of its universe. Place and universe names for all alerts
+    are resolved together, so many users joining the same game cost one metadata lookup.
+    """
+    alerts = []  # (channel, user_id, presence)
+    for guild_id, watched_places in server_place_ids.items():
+        guild = bot.get_guild(int(guild_id)) if watched_places else None
+        if not guild:
+            continue
+        # Servers set up before the Game Alerts channel existed get their alerts with the status updates
+        alert_channel = soul_channels.get_channel(guild, "game-alerts") or soul_channels.get_channel(guild, "status-updates")
+        if not alert_channel:
+            continue
+        watched_universes = {universe_id for universe_id in watched_places.values() if universe_id}
+        tracked_user_ids = set(server_user_ids.get(guild_id, []))
+        for user_id, presence in events:
+            if user_id in tracked_user_ids and (presence["place_id"] in watched_places or presence["universe_id"] in watched_universes):
+                alerts.append((alert_channel, user_id, presence))
+    if not alerts:
+        game_alert_stats["joins"] += len(events)
+        return
+
+    places = await game_metadata.resolve_places(presence["place_id"] for _, _, presence in alerts)
+    universe_ids = {
+        user_id: presence["universe_id"] or (places.get(presence["place_id"]) or {}).get("universe_id")
+        for _, user_id, presence in alerts
+    }
+    universes = await game_metadata.resolve_universes(universe_ids.values())
+    avatar_urls = await avatar_resolver.resolve_many(user_id for _, user_id, _ in alerts)
+
+    for alert_channel, user_id, presence in alerts:
+        user_details = await get_user_details(user_id)
+        notification_outbox.queue(alert_channel, build_game_alert_embed(
+            user_id, presence, user_details,
+            places.get(presence["place_id"]), universes.get(universe_ids[user_id]), avatar_urls.get(user_id)
+        ))
+    await notification_outbox.flush()
+    game_alert_stats["joins"] += len(events)
+    game_alert_stats["alerts"] += len(alerts)
+
+event_bus.subscribe(GameJoined, deliver_game_alerts, maxsize=1000, key=lambda event: event.user_id)
+
+def build_status_embed(user_id, current_status, user_details, avatar_url):
+    """
+    Build the embed announcing a tracked user's new status.
+    """
+    embed_color = discord.Color.blue()  # Default color for "Online"
+    if current_status == "In Game":
+        embed_color = discord.Color.green()  # Green for "In Game"
+    elif current_status == "Offline":
+        embed_color = discord.Color.red()  # Red for "Offline"
+
+    embed = discord.Embed(
+        title=f"{user_details['username']}",
+        color=embed_color
+    )
+    embed.add_field(name="Status", value=current_status, inline=False)
+    embed.add_field(name="Last Online", value="Recently" if current_status != "Offline" else "Unknown", inline=False)
+    embed.add_field(name="Description", value=user_details["description"], inline=False)
+    embed.add_field(name="Is Banned", value="Yes" if user_details["is_banned"] else "No", inline=False)
+    embed.add_field(name="USER ID", value=user_id, inline=False)
+    embed.add_field(name="DISPLAY NAME", value=user_details["display_name"], inline=False)
+    embed.add_field(name="USERNAME", value=user_details["username"], inline=False)
+
+    # Add the user's headshot as the thumbnail
+    if avatar_url:
+        embed.set_thumbnail(url=avatar_url)
+    return embed
+
+async def deliver_status_changes(events):
+    """
+    Announce a batch of status changes. Each transition is rendered once, with one user details
+    lookup and one headshot (resolved together for the whole batch), and that single embed is
+    queued to every channel announcing it. The cost of a change therefore does not grow with the
+    number of guilds tracking the user. Embeds are never modified once queued, so sharing one
+    between channels is safe.
+    """
+    avatar_urls = await avatar_resolver.resolve_many(event.user_id for event in events)
+    semaphore = asyncio.Semaphore(PRESENCE_WORKERS)
+
+    async def fetch_details(user_id):
+        async with semaphore:
+            return user_id, await get_user_details(user_id)
+
+    unique_user_ids = list(dict.fromkeys(event.user_id for event in events))
+    user_details = dict(await asyncio.gather(*(fetch_details(user_id) for user_id in unique_user_ids)))
+
+    # Events are queued in order, so every channel still gets its updates in the order they happened
+    for event in events:
+        embeds = {}  # status -> embed, shared by every channel announcing it
+        for status_channel, status in event.statuses.items():
+            if status not in embeds:
+                embeds[status] = build_status_embed(event.user_id, status, user_details[event.user_id], avatar_urls.get(event.user_id))
+            notification_outbox.queue(status_channel, embeds[status])
+    await notification_outbox.flush()
+
+def merge_status_changes(queued, newer):
+    # Each channel is told the latest status headed to it. Guilds can subscribe to different
+    # statuses, so a channel only the queued change was headed to keeps that change's status.
+    return newer._replace(statuses={**queued.statuses, **newer.statuses})
+
+def requeue_dropped_status_change(event):
+    # Not sent, so it must neither be lost nor saved in the snapshot as announced
+    presence_states.mark_unannounced(event.user_id, [str(status_channel.guild.id) for status_channel in event.statuses])
+
+# A user whose status changes again before the last change was announced stays one queued event
+event_bus.subscribe(
+    StatusChanged, deliver_status_changes, maxsize=STATUS_EVENT_QUEUE_SIZE,
+    key=lambda event: event.user_id, merge=merge_status_changes, on_drop=requeue_dropped_status_change
+)
+
+@tasks.loop(seconds=PRESENCE_TICK_SECONDS)
 async def check_status():
-    print(f"Checking status for servers: {server_user_ids.keys()}")  # Debug log
+    tick_started = time.monotonic()
+    deadline = tick_started + PRESENCE_TICK_DEADLINE
+    semaphore = asyncio.Semaphore(PRESENCE_WORKERS)
+
     guild_ids_to_remove = []  # Track guilds to remove from active checks
+    active_guilds = []  # (guild_id, status_channel, user_ids) for guilds that can receive updates
 
     for guild_id, user_ids in server_user_ids.items():
         guild = bot.get_guild(int(guild_id))
@@ -451,89 +2852,171 @@ async def check_status():
             guild_ids_to_remove.append(guild_id)  # Mark for removal
             continue
 
-        # Initialize data_cache for the guild if it doesn't exist
-        if guild_id not in data_cache:
-            data_cache[guild_id] = {}
-
-        # Get the Soul category and Status Updates channel
-        soul_category = discord.utils.get(guild.categories, name="Soul")
-        if not soul_category:
-            print(f"⚠️ Soul category not found in guild {guild.name}. Skipping...")
-            continue
-
-        status_channel = discord.utils.get(soul_category.channels, name="status-updates")
+        # Get the Status Updates channel from the Soul category
+        status_channel = soul_channels.get_channel(guild, "status-updates")
         if not status_channel:
-            print(f"⚠️ Status Updates channel not found in guild {guild.name}. Skipping...")
             continue
 
-        print(f"Processing guild: {guild.name}, channel: {status_channel.name}")  # Debug log
-
-        for user_id in user_ids:
-            # Ensure the user ID exists in the data_cache for this guild
-            if user_id not in data_cache[guild_id]:
-                data_cache[guild_id][user_id] = {"last_status": None}
-
-            current_status = get_roblox_presence(user_id)
-            previous_status = data_cache[guild_id][user_id]["last_status"]
-
-            # Avoid sending duplicate status updates
-            if current_status == previous_status:
-                continue
-
-            data_cache[guild_id][user_id]["last_status"] = current_status
+        active_guilds.append((guild_id, status_channel, user_ids))
+
+    # Poll only the users that are due, once each no matter how many guilds track them,
+    # and never more than the presence request budget allows
+    active_user_ids = {guild_id: user_ids for guild_id, _, user_ids in active_guilds}
+    presence_scheduler.sync(active_user_ids)  # Also brings presence_states in line
+    max_users = max(1, int(PRESENCE_REQUESTS_PER_SECOND * PRESENCE_TICK_SECONDS)) * PRESENCE_BATCH_SIZE
+    due_user_ids = presence_scheduler.pop_due(max_users)
+
+    # Each batch is polled by its own worker; batches still running at the deadline are carried over
+    poll_tasks = {}
+    for start in range(0, len(due_user_ids), PRESENCE_BATCH_SIZE):
+        batch = due_user_ids[start:start + PRESENCE_BATCH_SIZE]
+        poll_tasks[asyncio.create_task(poll_presence_batch(batch, semaphore))] = batch
+
+    statuses = {}
+    presences = {}
+    carried_over_polls = 0
+    presence_bucket = rate_limiter.bucket(get_endpoint_family(PRESENCE_URL))
+    waited_before = presence_bucket.waited
+    if poll_tasks:
+        pending = set(poll_tasks)
+        while pending:
+            # Time the presence rate limit held the polls back is not counted against the deadline;
+            # cancelling them would only make them wait for the same bucket again next tick
+            remaining = deadline + (presence_bucket.waited - waited_before) - time.monotonic()
+            if remaining <= 0:
+                break
+            _, pending = await asyncio.wait(pending, timeout=remaining)
+        for task in pending:
+            task.cancel()
+        done = poll_tasks.keys() - pending
+
+        for task, batch in poll_tasks.items():
+            batch_presences = task.result() if task in done and task.exception() is None else {}
+            presences.update(batch_presences)
+            for user_id in batch:
+                if user_id in batch_presences and batch_presences[user_id]["status"] != "Unknown":
+                    statuses[user_id] = batch_presences[user_id]["status"]
+                    presence_scheduler.record(user_id, statuses[user_id])
+                elif task in pending:
+                    presence_scheduler.retry(user_id, delay=0)  # Missed the deadline; first in line next tick
+                    carried_over_polls += 1
+                else:
+                    presence_scheduler.retry(user_id)
+
+    # Only users polled this tick can have changed; each change is published once, for every guild
+    # tracking the user that subscribed to it. Changes nobody wants are never fetched or rendered.
+    status_channels = {guild_id: status_channel for guild_id, status_channel, _ in active_guilds}
+    for user_id, current_status, guild_ids in presence_states.diff(statuses):
+        recipients = status_subscriptions.recipients(user_id, current_status, guild_ids)
+        if recipients:
+            event_bus.publish(StatusChanged(user_id, {status_channels[guild_id]: current_status for guild_id in recipients}))
+
+    # Alert servers watching the games tracked users just joined
+    for user_id, presence in detect_game_joins(presences):
+        event_bus.publish(GameJoined(user_id, presence))
+
+    presence_tick_stats["ticks"] += 1
+    presence_tick_stats["polled"] += len(due_user_ids)
+
+    # Log ticks that ran out of time, and how much work they left for the next one. Waiting for
+    # the rate limit is Roblox pacing us, not the tick being too slow, so it does not count.
+    tick_duration = time.monotonic() - tick_started
+    throttled_for = presence_bucket.waited - waited_before
+    if carried_over_polls or tick_duration - throttled_for > PRESENCE_TICK_SECONDS:
+        overrun_message = (
+            f"check_status tick overran: took {tick_duration:.1f}s ({throttled_for:.1f}s of it rate limited; "
+            f"deadline {PRESENCE_TICK_DEADLINE:.1f}s, tick {PRESENCE_TICK_SECONDS}s), carried over {carried_over_polls} polls"
+        )
+        log_error(overrun_message)
+        print(f"⚠️ {overrun_message}")
 
-            # Fetch user details
-            user_details = get_user_details(user_id)
+    # Remove guilds that are no longer present
+    for guild_id in guild_ids_to_remove:
+        print(f"⚠️ Removing guild ID {guild_id} from active checks.")
+        server_user_ids.pop(guild_id, None)  # Remove from server_user_ids
+        server_place_ids.pop(guild_id, None)
+        server_item_ids.pop(guild_id, None)
+        status_subscriptions.remove_guild(guild_id)
+        for group_id in list(group_watches.guild_group_ids.get(guild_id, [])):
+            await group_watches.remove(guild_id, group_id)
+        await soul_store.remove_guild(guild_id)  # Delete everything the guild tracks from the database
+
+@tasks.loop(seconds=PRESENCE_STATS_SECONDS)
+async def log_presence_stats():
+    """
+    Print a one-line summary of the presence pipeline once per PRESENCE_STATS_SECONDS rather than
+    on every check_status tick. The full stats of every component follow when SOUL_DEBUG_STATS is set.
+    """
+    states = presence_states.stats()
+    status_queue = event_bus.stats().get(StatusChanged.__name__, {})
+    print(
+        f"Presence: {presence_tick_stats['ticks']} ticks polled {presence_tick_stats['polled']} users "
+        f"({states['users']} tracked in {states['guilds']} guilds); "
+        f"{status_queue.get('queued', 0)} status changes queued, {status_queue.get('dropped', 0)} dropped; "
+        f"{notification_outbox.embeds_sent} embeds sent in {notification_outbox.messages_sent} messages; "
+        f"{game_alert_stats['joins']} game joins, {game_alert_stats['alerts']} alerts"
+    )
+    presence_tick_stats["ticks"] = presence_tick_stats["polled"] = 0
+    if not PRESENCE_STATS_VERBOSE:
+        return
 
-            # Fetch the user's headshot URL
-            avatar_url = f"https://thumbnails.roblox.com/v1/users/avatar-headshot?userIds={user_id}&size=352x352&format=Png&isCircular=false"
-            try:
-                response = requests.get(avatar_url)
-                response.raise_for_status()
-                avatar_data = response.json()
-                avatar_url = avatar_data["data"][0]["imageUrl"]
-            except Exception as e:
-                log_error(e)
-                avatar_url = None
+    print(f"User details cache: {user_details_cache.stats()}")  # Debug log
+    print(f"Cookie pool: {cookie_pool.stats()}")  # Debug log
+    print(f"Notification outbox: {notification_outbox.embeds_sent} embeds in {notification_outbox.messages_sent} messages")  # Debug log
+    print(f"Event queues: {event_bus.stats()}")  # Debug log
+    print(f"Game alerts: {game_alert_stats['joins']} joins, {game_alert_stats['alerts']} alerts sent")  # Debug log
+    print(f"Presence scheduler: {presence_scheduler.stats()}")  # Debug log
+    guild_lags = sorted(presence_scheduler.guild_lag().items(), key=lambda item: item[1], reverse=True)[:5]
+    if guild_lags:
+        print(f"Most lagging guilds: {', '.join(f'{guild_id} ({lag:.0f}s)' for guild_id, lag in guild_lags)}")  # Debug log
+
+async def save_presence_snapshot():
+    """
+    Save every guild's last announced statuses so the next start picks up where this one left off.
+    Statuses still waiting in the event queue are left out, so they are announced after a restart
+    instead of being taken as already sent.
+    """
+    undelivered = {
+        (str(status_channel.guild.id), event.user_id)
+        for event in event_bus.pending(StatusChanged)
+        for status_channel in event.statuses
+    }
+    rows = presence_states.snapshot_rows(undelivered)
+    try:
+        await soul_store.save_presence_snapshot(rows)
+        print(f"Presence snapshot saved: {len(rows)} statuses.")  # Debug log
+    except Exception as e:
+        log_error(e)
+        print(f"Failed to save the presence snapshot: {e}")
 
-            # Create an embed for the status update
-            embed_color = discord.Color.blue()  # Default color for "Online"
-            if current_status == "In Game":
-                embed_color = discord.Color.green()  # Green for "In Game"
-            elif current_status == "Offline":
-                embed_color = discord.Color.red()  # Red for "Offline"
+@tasks.loop(minutes=PRESENCE_SNAPSHOT_MINUTES)
+async def presence_snapshot_task():
+    await save_presence_snapshot()
 
-            embed = discord.Embed(
-                title=f"{user_details['username']}",
-                color=embed_color
-            )
-            embed.add_field(name="Status", value=current_status, inline=False)
-            embed.add_field(name="Last Online", value="Recently" if current_status != "Offline" else "Unknown", inline=False)
-            embed.add_field(name="Description", value=user_details["description"], inline=False)
-            embed.add_field(name="Is Banned", value="Yes" if user_details["is_banned"] else "No", inline=False)
-            embed.add_field(name="USER ID", value=user_id, inline=False)
-            embed.add_field(name="DISPLAY NAME", value=user_details["display_name"], inline=False)
-            embed.add_field(name="USERNAME", value=user_details["username"], inline=False)
+@bot.event
+async def on_guild_channel_create(channel):
+    soul_channels.rebuild(channel.guild)
 
-            # Add the user's headshot as the thumbnail
-            if avatar_url:
-                embed.set_thumbnail(url=avatar_url)
+@bot.event
+async def on_guild_channel_update(before, after):
+    soul_channels.rebuild(after.guild)
 
-            # Send the embed to the Status Updates channel
-            await status_channel.send(embed=embed)
+@bot.event
+async def on_guild_channel_delete(channel):
+    soul_channels.rebuild(channel.guild)
+    webhook_delivery.forget(channel.id)
 
-    # Remove guilds that are no longer present
-    for guild_id in guild_ids_to_remove:
-        print(f"⚠️ Removing guild ID {guild_id} from active checks.")
-        server_user_ids.pop(guild_id, None)  # Remove from server_user_ids
-        data_cache.pop(guild_id, None)  # Remove from data_cache
-        save_server_user_ids()  # Save updated user IDs to file
+@bot.event
+async def on_guild_remove(guild):
+    soul_channels.remove(guild.id)
 
 @bot.event
 async def on_guild_join(guild):
     """
     Sends a welcome message with the bot's README content when added to a new server.
     """
+    soul_channels.rebuild(guild)
+
     # Find a general or default text channel to send the message
     default_channel = next((channel for channel in guild.text_channels if channel.permissions_for(guild.me).send_messages), None)
     if not default_channel:
@@ -584,7 +3067,7 @@ async def on_guild_join(guild):
         color=discord.Color.blue()
     )
     welcome_embed.add_field(name="Overview", value=overview_text[:1024], inline=False)
-    welcome_embed.embed.description = "Visit [SOUL's Website](https://www.soullessgraves) for more information and support."
+    welcome_embed.description += "\n\nVisit [SOUL's Website](https://www.soullessgraves) for more information and support."
 
     # Create the Commands Page embeds
     commands_embeds = []
@@ -594,7 +3077,7 @@ async def on_guild_join(guild):
             description=chunk,
             color=discord.Color.blue()
         )
-        commands_embed.embed.description = "Visit [SOUL's Website](https://www.soullessgraves) for more information and support."
+        commands_embed.description += "\n\nVisit [SOUL's Website](https://www.soullessgraves) for more information and support."
         commands_embeds.append(commands_embed)
 
     # Send the embeds sequentially
@@ -651,12 +3134,9 @@ async def track_command(interaction: discord.Interaction, user_input: str):
     # Validate the input
     if not user_input.isdigit():
         # Resolve username to user ID
-        url = f"https://users.roblox.com/v1/usernames/users"
         try:
-            response = requests.post(url, json={"usernames": [user_input]})
-            response.raise_for_status()
-            data = response.json()
-            if not data["data"]:
+            user_id = await username_resolver.resolve(user_input)
+            if user_id is None:
                 error_embed = discord.Embed(
                     title="Invalid Input",
                     description=f"No user found with the username '{user_input}'.",
@@ -664,7 +3144,6 @@ async def track_command(interaction: discord.Interaction, user_input: str):
                 )
                 await interaction.response.send_message(embed=error_embed, ephemeral=True)
                 return
-            user_id = str(data["data"][0]["id"])
         except Exception as e:
             log_error(e)
             error_embed = discord.Embed(
@@ -689,7 +3168,7 @@ async def track_command(interaction: discord.Interaction, user_input: str):
 
     # Add the user to the tracker
     server_user_ids[guild_id].append(user_id)
-    save_server_user_ids()
+    await soul_store.add_tracked_user(guild_id, user_id)
 
     success_embed = discord.Embed(
         title="User Tracked",
@@ -712,12 +3191,9 @@ async def untrack_command(interaction: discord.Interaction, user_input: str):
     # Validate the input
     if not user_input.isdigit():
         # Resolve username to user ID
-        url = f"https://users.roblox.com/v1/usernames/users"
         try:
-            response = requests.post(url, json={"usernames": [user_input]})
-            response.raise_for_status()
-            data = response.json()
-            if not data["data"]:
+            user_id = await username_resolver.resolve(user_input)
+            if user_id is None:
                 error_embed = discord.Embed(
                     title="User Not Found",
                     description=f"No user found with the username '{user_input}'.",
@@ -725,7 +3201,6 @@ async def untrack_command(interaction: discord.Interaction, user_input: str):
                 )
                 await interaction.response.send_message(embed=error_embed, ephemeral=True)
                 return
-            user_id = str(data["data"][0]["id"])
         except Exception as e:
             log_error(e)
             error_embed = discord.Embed(
@@ -748,9 +3223,15 @@ async def untrack_command(interaction: discord.Interaction, user_input: str):
         await interaction.response.send_message(embed=error_embed, ephemeral=True)
         return
 
-    # Remove the user from the tracker
+    # Remove the user from the tracker, along with this server's subscriptions to them
     server_user_ids[guild_id].remove(user_id)
-    save_server_user_ids()
+    await soul_store.remove_tracked_user(guild_id, user_id)
+    status_subscriptions.remove(guild_id, user_id)
+    await soul_store.remove_status_subscription(guild_id, user_id)
+
+    # Forget cached profile data once no server tracks the user anymore
+    if not await soul_store.is_user_tracked(user_id):
+        invalidate_user_details(user_id)
 
     success_embed = discord.Embed(
         title="User Untracked",
@@ -759,6 +3240,92 @@ async def untrack_command(interaction: discord.Interaction, user_input: str):
     )
     await interaction.response.send_message(embed=success_embed, ephemeral=True)
 
+@tree.command(name="subscribe", description="Only announce chosen statuses of a tracked Roblox user.")
+@app_commands.describe(user_input="The Roblox user ID or username to subscribe to.", status="The status to announce.")
+@app_commands.choices(status=[app_commands.Choice(name=status, value=status) for status in STATUS_MAP.values()])
+async def subscribe_command(interaction: discord.Interaction, user_input: str, status: app_commands.Choice[str]):
+    """
+    Subscribe this server to one status of a tracked user. Once a server subscribes to any status
+    of a user, only the statuses it subscribed to are announced for that user.
+    """
+    await update_status_subscription(interaction, user_input, status.value, subscribe=True)
+
+
+@tree.command(name="unsubscribe", description="Stop announcing a status of a tracked Roblox user.")
+@app_commands.describe(user_input="The Roblox user ID or username to unsubscribe from.", status="The status to stop announcing.")
+@app_commands.choices(status=[app_commands.Choice(name=status, value=status) for status in STATUS_MAP.values()])
+async def unsubscribe_command(interaction: discord.Interaction, user_input: str, status: app_commands.Choice[str]):
+    """
+    Remove one of this server's status subscriptions. Without any subscriptions left, every status
+    of the user is announced again.
+    """
+    await update_status_subscription(interaction, user_input, status.value, subscribe=False)
+
+async def update_status_subscription(interaction: discord.Interaction, user_input: str, status: str, subscribe: bool):
+    guild_id = str(interaction.guild_id)
+
+    # Validate the input
+    if not user_input.isdigit():
+        # Resolve username to user ID
+        try:
+            user_id = await username_resolver.resolve(user_input)
+            if user_id is None:
+                error_embed = discord.Embed(
+                    title="User Not Found",
+                    description=f"No user found with the username '{user_input}'.",
+                    color=discord.Color.red()
+                )
+                await interaction.response.send_message(embed=error_embed, ephemeral=True)
+                return
+        except Exception as e:
+            log_error(e)
+            error_embed = discord.Embed(
+                title="Error",
+                description=f"Failed to resolve username '{user_input}' to a user ID.",
+                color=discord.Color.red()
+            )
+            await interaction.response.send_message(embed=error_embed, ephemeral=True)
+            return
+    else:
+        user_id = user_input
+
+    # Subscriptions only apply to users this server tracks
+    if user_id not in server_user_ids.get(guild_id, []):
+        error_embed = discord.Embed(
+            title="User Not Tracked",
+            description=f"User ID `{user_id}` is not being tracked. Track them with `/track` first.",
+            color=discord.Color.red()
+        )
+        await interaction.response.send_message(embed=error_embed, ephemeral=True)
+        return
+
+    subscribed_statuses = status_subscriptions.statuses_for(guild_id, user_id)
+    if subscribe == (status in subscribed_statuses):
+        error_embed = discord.Embed(
+            title="Already Subscribed" if subscribe else "Not Subscribed",
+            description=f"This server is {'already' if subscribe else 'not'} subscribed to **{status}** for user ID `{user_id}`.",
+            color=discord.Color.orange()
+        )
+        await interaction.response.send_message(embed=error_embed, ephemeral=True)
+        return
+
+    if subscribe:
+        status_subscriptions.add(guild_id, user_id, status)
+        await soul_store.add_status_subscription(guild_id, user_id, status)
+        subscribed_statuses.add(status)
+    else:
+        status_subscriptions.remove(guild_id, user_id, status)
+        await soul_store.remove_status_subscription(guild_id, user_id, status)
+        subscribed_statuses.discard(status)
+
+    announced = ", ".join(sorted(subscribed_statuses)) if subscribed_statuses else "every status"
+    success_embed = discord.Embed(
+        title="Subscribed" if subscribe else "Unsubscribed",
+        description=f"Status updates for user ID `{user_id}` now announce: **{announced}**.",
+        color=discord.Color.green()
+    )
+    await interaction.response.send_message(embed=success_embed, ephemeral=True)
+
 @tree.command(name="setup", description="Set up the bot's categories and channels.")
 async def setup_command(interaction: discord.Interaction):
     """
@@ -784,6 +3351,8 @@ async def setup_command(interaction: discord.Interaction):
                     "**Soul**:\n"
                     "- **Added/Removed Users Logs**: Logs added and removed users.\n"
                     "- **Status Updates**: Posts status updates for tracked users.\n"
+                    "- **Group Updates**: Posts group joins, leaves and shouts.\n"
+                    "- **Game Alerts**: Posts when tracked users join watched games.\n"
                     "- **Changelogs**: Posts bot changelogs.\n\n"
                     "Do you want me to create these? (yes/no)",
         color=discord.Color.blue()
@@ -806,6 +3375,8 @@ async def setup_command(interaction: discord.Interaction):
     soul_category = await guild.create_category("Soul")
     await guild.create_text_channel("Added/Removed Users Logs", category=soul_category)
     await guild.create_text_channel("Status Updates", category=soul_category)
+    await guild.create_text_channel("Group Updates", category=soul_category)
+    await guild.create_text_channel("Game Alerts", category=soul_category)
     await guild.create_text_channel("Changelogs", category=soul_category)
 
     success_embed = discord.Embed(
@@ -857,12 +3428,9 @@ async def whois_command(interaction: discord.Interaction, user_input: str):
     if user_input.isdigit():
         user_id = user_input
     else:
-        url = "https://users.roblox.com/v1/usernames/users"
         try:
-            response = requests.post(url, json={"usernames": [user_input]})
-            response.raise_for_status()
-            data = response.json()
-            if not data["data"]:
+            user_id = await username_resolver.resolve(user_input)
+            if user_id is None:
                 error_embed = discord.Embed(
                     title="User Not Found",
                     description=f"No user found with the username '{user_input}'.",
@@ -870,7 +3438,6 @@ async def whois_command(interaction: discord.Interaction, user_input: str):
                 )
                 await interaction.response.send_message(embed=error_embed, ephemeral=True)
                 return
-            user_id = str(data["data"][0]["id"])
         except Exception as e:
             log_error(e)
             error_embed = discord.Embed(
@@ -882,7 +3449,7 @@ async def whois_command(interaction: discord.Interaction, user_input: str):
             return
 
     # Fetch user details
-    user_details = get_user_details(user_id)
+    user_details = await get_user_details(user_id)
     if user_details["username"] == "No username":
         error_embed = discord.Embed(
             title="User Not Found",
@@ -893,15 +3460,7 @@ async def whois_command(interaction: discord.Interaction, user_input: str):
         return
 
     # Fetch the user's headshot URL
-    avatar_url = f"https://thumbnails.roblox.com/v1/users/avatar-headshot?userIds={user_id}&size=352x352&format=Png&isCircular=false"
-    try:
-        response = requests.get(avatar_url)
-        response.raise_for_status()
-        avatar_data = response.json()
-        avatar_url = avatar_data["data"][0]["imageUrl"]
-    except Exception as e:
-        log_error(e)
-        avatar_url = None
+    avatar_url = await avatar_resolver.resolve(user_id)
 
     # Add account creation date
     creation_date = user_details.get("created", "Unknown")
@@ -916,7 +3475,8 @@ async def whois_command(interaction: discord.Interaction, user_input: str):
     embed.add_field(name="User ID", value=user_id, inline=False)
     embed.add_field(name="Is Banned", value="Yes" if user_details["is_banned"] else "No", inline=False)
     embed.add_field(name="Account Created", value=formatted_creation_date, inline=False)
-    embed.set_thumbnail(url=avatar_url)
+    if avatar_url:
+        embed.set_thumbnail(url=avatar_url)
 
     # Send the embed
     await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -931,9 +3491,7 @@ async def whois_display_command(interaction: discord.Interaction, display_name:
     # Search for users by display name
     url = "https://users.roblox.com/v1/users/search"
     try:
-        response = requests.get(url, params={"keyword": display_name, "limit": 10})  # Limit results to 10
-        response.raise_for_status()
-        data = response.json()
+        data = await roblox_request("GET", url, params={"keyword": display_name, "limit": 10})  # Limit results to 10
         users = data.get("data", [])
     except Exception as e:
         log_error(e)
@@ -955,23 +3513,16 @@ async def whois_display_command(interaction: discord.Interaction, display_name:
         await interaction.response.send_message(embed=error_embed, ephemeral=True)
         return
 
+    # Fetch every user's headshot URL in a single request
+    avatar_urls = await avatar_resolver.resolve_many(user["id"] for user in users if "id" in user)
+
     # Create embeds for each user
     embeds = []
     for user in users:
         user_id = user.get("id", "Unknown")
         username = user.get("name", "Unknown")
         display_name = user.get("displayName", "Unknown")
-
-        # Fetch the user's headshot URL
-        avatar_url = f"https://thumbnails.roblox.com/v1/users/avatar-headshot?userIds={user_id}&size=352x352&format=Png&isCircular=false"
-        try:
-            response = requests.get(avatar_url)
-            response.raise_for_status()
-            avatar_data = response.json()
-            avatar_url = avatar_data["data"][0]["imageUrl"]
-        except Exception as e:
-            log_error(e)
-            avatar_url = None
+        avatar_url = avatar_urls.get(str(user_id))
 
         # Create an embed for the user
         embed = discord.Embed(
@@ -983,9 +3534,10 @@ async def whois_display_command(interaction: discord.Interaction, display_name:
             embed.set_thumbnail(url=avatar_url)
         embeds.append(embed)
 
-    # Send the embeds
-    for embed in embeds:
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    # Send the embeds (an interaction can only be responded to once, so send them together)
+    await interaction.response.send_message(embeds=embeds, ephemeral=True)
+
+PRICE_HISTORY_SUMMARY_WINDOW = 7 * 24 * 60 * 60  # seconds of recorded prices summarized by /item
 
 @tree.command(name="item", description="Fetch details about a Roblox limited item by its ID.")
 @app_commands.describe(item_id="The ID of the Roblox limited item.")
@@ -997,16 +3549,9 @@ async def item_command(interaction: discord.Interaction, item_id: int):
     catalog_url = f"https://catalog.roblox.com/v1/catalog/items/details"
     thumbnail_url = f"https://thumbnails.roblox.com/v1/assets?assetIds={item_id}&size=420x420&format=Png&isCircular=false"
 
-    headers = {
-        "Content-Type": "application/json",
-        "Cookie": f".ROBLOSECURITY={get_next_cookie()}"
-    }
-
     try:
         # Fetch resale data
-        resale_response = requests.get(resale_url, headers=headers)
-        resale_response.raise_for_status()
-        resale_data = resale_response.json()
+        resale_data = await roblox_request("GET", resale_url, authenticated=True)
 
         # Check if the item is limited by verifying resale-related fields
         if "recentAveragePrice" not in resale_data or "priceDataPoints" not in resale_data:
@@ -1020,9 +3565,7 @@ async def item_command(interaction: discord.Interaction, item_id: int):
 
         # Fetch catalog data for item details
         catalog_payload = {"items": [{"itemType": "Asset", "id": item_id}]}
-        catalog_response = requests.post(catalog_url, json=catalog_payload, headers=headers)
-        catalog_response.raise_for_status()
-        catalog_data = catalog_response.json()
+        catalog_data = await roblox_request("POST", catalog_url, json_data=catalog_payload, authenticated=True)
 
         # Extract item details from catalog data
         if not catalog_data.get("data"):
@@ -1032,9 +3575,7 @@ async def item_command(interaction: discord.Interaction, item_id: int):
         creator_name = catalog_item.get("creator", {}).get("name", "Unknown Creator")
 
         # Fetch item thumbnail
-        thumbnail_response = requests.get(thumbnail_url)
-        thumbnail_response.raise_for_status()
-        thumbnail_data = thumbnail_response.json()
+        thumbnail_data = await roblox_request("GET", thumbnail_url)
         thumbnail_image_url = thumbnail_data["data"][0].get("imageUrl", None)
 
         # Extract item details from resale data
@@ -1052,6 +3593,16 @@ async def item_command(interaction: discord.Interaction, item_id: int):
         embed.add_field(name="Creator", value=creator_name, inline=False)
         embed.add_field(name="Item ID", value=item_id, inline=False)
 
+        # Summarize the price history recorded while the item was tracked
+        price_history = await soul_store.get_price_history(item_id, since=time.time() - PRICE_HISTORY_SUMMARY_WINDOW)
+        recorded_prices = [price for _, price in price_history if price is not None]
+        if recorded_prices:
+            embed.add_field(
+                name="Tracked Price (7 days)",
+                value=f"Low: {min(recorded_prices)} Robux\nHigh: {max(recorded_prices)} Robux\nObservations: {len(recorded_prices)}",
+                inline=False
+            )
+
         # Add the item's image as the embed thumbnail
         if thumbnail_image_url:
             embed.set_thumbnail(url=thumbnail_image_url)
@@ -1067,7 +3618,7 @@ async def item_command(interaction: discord.Interaction, item_id: int):
         )
         await interaction.response.send_message(embed=error_embed, ephemeral=True)
 
-    except requests.exceptions.RequestException as e:
+    except RobloxAPIError as e:
         log_error(e)
         error_embed = discord.Embed(
             title="Error",
@@ -1100,9 +3651,7 @@ async def track_item_command(interaction: discord.Interaction, item_id: int):
     # Fetch resale data to check if the item is limited
     resale_url = f"https://economy.roblox.com/v1/assets/{item_id}/resale-data"
     try:
-        resale_response = requests.get(resale_url)
-        resale_response.raise_for_status()
-        resale_data = resale_response.json()
+        resale_data = await roblox_request("GET", resale_url)
 
         # Check if the item is limited by verifying resale-related fields
         if "recentAveragePrice" not in resale_data or "priceDataPoints" not in resale_data:
@@ -1115,7 +3664,10 @@ async def track_item_command(interaction: discord.Interaction, item_id: int):
             return
 
         # Add the item to the tracking list
-        server_item_ids[guild_id][item_id] = {"last_price": resale_data.get("recentAveragePrice", None)}
+        current_price = resale_data.get("recentAveragePrice", None)
+        server_item_ids[guild_id][item_id] = {"last_price": current_price}
+        await soul_store.add_tracked_item(guild_id, item_id, current_price)
+        await soul_store.record_item_prices({item_id: current_price})
         success_embed = discord.Embed(
             title="Item Tracked",
             description=f"Item ID `{item_id}` has been added to the tracking list.",
@@ -1123,7 +3675,7 @@ async def track_item_command(interaction: discord.Interaction, item_id: int):
         )
         await interaction.response.send_message(embed=success_embed, ephemeral=True)
 
-    except requests.exceptions.RequestException as e:
+    except RobloxAPIError as e:
         log_error(e)
         error_embed = discord.Embed(
             title="Error",
@@ -1137,17 +3689,14 @@ async def string_command(interaction: discord.Interaction):
     """
     Generate a 20-character random string and check if it's available as a username.
     """
-    url = "https://users.roblox.com/v1/usernames/users"
-    while True:
-        random_string = ''.join(random.choices(string.ascii_letters, k=20))
+    random_string = None
+    while random_string is None:
+        # Check a handful of candidates in one request and keep the first unused one
+        candidates = [''.join(random.choices(string.ascii_letters, k=20)) for _ in range(5)]
         try:
-            response = requests.post(url, json={"usernames": [random_string]})
-            response.raise_for_status()
-            data = response.json()
-
-            if not data["data"]:  # If the string is not in use
-                break
-        except requests.exceptions.RequestException as e:
+            resolved = await username_resolver.resolve_many(candidates, cache=False)
+            random_string = next((candidate for candidate in candidates if resolved[candidate] is None), None)
+        except RobloxAPIError as e:
             log_error(e)
             error_embed = discord.Embed(
                 title="Error",
@@ -1180,13 +3729,10 @@ async def user_command(interaction: discord.Interaction, word: str):
         await interaction.response.send_message(embed=error_embed, ephemeral=True)
         return
 
-    url = "https://users.roblox.com/v1/usernames/users"
     try:
-        response = requests.post(url, json={"usernames": [word]})
-        response.raise_for_status()
-        data = response.json()
+        user_id = await username_resolver.resolve(word)
 
-        if data["data"]:  # If the word is found in the results
+        if user_id is not None:  # If the word is already someone's username
             suggestions = [f"{word[:15]}{random.randint(1, 9999)}" for _ in range(3)]
             embed = discord.Embed(
                 title="Username Unavailable",
@@ -1202,7 +3748,7 @@ async def user_command(interaction: discord.Interaction, word: str):
             )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
-    except requests.exceptions.RequestException as e:
+    except RobloxAPIError as e:
         log_error(e)
         error_embed = discord.Embed(
             title="Error",
@@ -1231,13 +3777,10 @@ async def gen_command(interaction: discord.Interaction, option: int, word: str =
             return
 
         # Check if the word is already in use as a username
-        url = "https://users.roblox.com/v1/usernames/users"
         try:
-            response = requests.post(url, json={"usernames": [word]})
-            response.raise_for_status()
-            data = response.json()
+            user_id = await username_resolver.resolve(word)
 
-            if data["data"]:  # If the word is found in the results
+            if user_id is not None:  # If the word is already someone's username
                 # Suggest adding numbers to the username
                 suggestions = [f"{word[:15]}{random.randint(1, 9999)}" for _ in range(3)]
                 embed = discord.Embed(
@@ -1254,7 +3797,7 @@ async def gen_command(interaction: discord.Interaction, option: int, word: str =
                 )
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
-        except requests.exceptions.RequestException as e:
+        except RobloxAPIError as e:
             log_error(e)
             error_embed = discord.Embed(
                 title="Error",
@@ -1307,10 +3850,16 @@ async def support_command(interaction: discord.Interaction):
     embed.add_field(name="/gen", value="Generate a username or random string.\nUsage: `/gen` with options 1 or 2.", inline=False)
     embed.add_field(name="/item", value="Fetch details about a Roblox limited item by its ID.\nUsage: `/item <item_id>`", inline=False)
     embed.add_field(name="/trackitem", value="Track a Roblox limited item by its ID.\nUsage: `/trackitem <item_id>`", inline=False)
+    embed.add_field(name="/watchgroup", value="Post a Roblox group's joins, leaves and shouts in this server.\nUsage: `/watchgroup <group_id>`", inline=False)
+    embed.add_field(name="/unwatchgroup", value="Stop monitoring a Roblox group in this server.\nUsage: `/unwatchgroup <group_id>`", inline=False)
+    embed.add_field(name="/watchplace", value="Get an alert when a tracked user joins a Roblox game.\nUsage: `/watchplace <place_id>`", inline=False)
+    embed.add_field(name="/unwatchplace", value="Stop game alerts for a Roblox place.\nUsage: `/unwatchplace <place_id>`", inline=False)
+    embed.add_field(name="/subscribe", value="Only announce chosen statuses of a tracked Roblox user.\nUsage: `/subscribe <user> <status>`", inline=False)
+    embed.add_field(name="/unsubscribe", value="Stop announcing a status of a tracked Roblox user.\nUsage: `/unsubscribe <user> <status>`", inline=False)
     embed.add_field(name="/setup", value="Set up the bot's categories and channels.\nUsage: `/setup`", inline=False)
     embed.add_field(name="/unsetup", value="Remove the bot's categories and channels.\nUsage: `/unsetup`", inline=False)
     embed.add_field(name="/support", value="Show this help message.\nUsage: `/support`", inline=False)
-    embed.embed.description = "Visit [SOUL's Website](https://www.soullessgraves) for more information and support."
+    embed.description += "\n\nVisit [SOUL's Website](https://www.soullessgraves) for more information and support."
 
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -1344,20 +3893,21 @@ async def tracking_command(interaction: discord.Interaction):
     for user_id in tracked_users:
         embed.add_field(name="User ID", value=user_id, inline=False)
 
+    # Show how far behind status polling is running for this server
+    polling_lag = presence_scheduler.guild_lag().get(guild_id, 0)
+    embed.set_footer(text=f"Status polling lag: {polling_lag:.0f}s")
+
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
 @tree.command(name="group", description="Fetch details about a Roblox group by its ID.")
 @app_commands.describe(group_id="The ID of the Roblox group to search for.")
 async def group_command(interaction: discord.Interaction, group_id: int):
-    group_details_url = f"https://groups.roblox.com/v1/groups/{group_id}"
     logo_url = f"https://thumbnails.roblox.com/v1/groups/icons?groupIds={group_id}&size=512x512&format=Png&isCircular=false"
 
     try:
         # Fetch group details
-        response = requests.get(group_details_url)
-        response.raise_for_status()
-        group_data = response.json()
+        group_data = await fetch_group_details(group_id)
 
         # Debug log for API response
         print(f"Group API Response: {group_data}")
@@ -1373,11 +3923,9 @@ async def group_command(interaction: discord.Interaction, group_id: int):
         # Attempt to fetch group logo
         logo_image_url = None
         try:
-            logo_response = requests.get(logo_url)
-            logo_response.raise_for_status()
-            logo_data = logo_response.json()
+            logo_data = await roblox_request("GET", logo_url)
             logo_image_url = logo_data["data"][0].get("imageUrl", None)
-        except requests.exceptions.RequestException as e:
+        except RobloxAPIError as e:
             print(f"⚠️ Failed to fetch group logo: {e}")
             logo_image_url = "https://via.placeholder.com/512?text=No+Logo"  # Fallback placeholder image
 
@@ -1406,7 +3954,7 @@ async def group_command(interaction: discord.Interaction, group_id: int):
             color=discord.Color.red()
         )
         await interaction.response.send_message(embed=error_embed, ephemeral=True)
-    except requests.exceptions.RequestException as e:
+    except RobloxAPIError as e:
         log_error(e)
         print(f"RequestException: {e}")
         error_embed = discord.Embed(
@@ -1416,12 +3964,145 @@ async def group_command(interaction: discord.Interaction, group_id: int):
         )
         await interaction.response.send_message(embed=error_embed, ephemeral=True)
 
+@tree.command(name="watchgroup", description="Post a Roblox group's joins, leaves and shouts in this server.")
+@app_commands.describe(group_id="The ID of the Roblox group to monitor.")
+async def watch_group_command(interaction: discord.Interaction, group_id: int):
+    """
+    Start monitoring a Roblox group for this server.
+    """
+    guild_id = str(interaction.guild_id)
+    if group_id == GROUP_ID or group_watches.is_watching(guild_id, group_id):
+        error_embed = discord.Embed(
+            title="Group Already Monitored",
+            description=f"Group ID `{group_id}` is already being monitored in this server.",
+            color=discord.Color.orange()
+        )
+        await interaction.response.send_message(embed=error_embed, ephemeral=True)
+        return
+
+    # Make sure the group exists before polling it
+    try:
+        group_data = await fetch_group_details(group_id)
+    except RobloxAPIError as e:
+        log_error(e)
+        error_embed = discord.Embed(
+            title="Invalid Group ID",
+            description=f"No group found with the ID `{group_id}`.",
+            color=discord.Color.red()
+        )
+        await interaction.response.send_message(embed=error_embed, ephemeral=True)
+        return
+
+    await group_watches.add(guild_id, group_id)
+    success_embed = discord.Embed(
+        title="Group Monitored",
+        description=f"**{group_data.get('name', 'Unknown Group')}** (`{group_id}`) joins, leaves and shouts will be posted in the Group Updates channel.",
+        color=discord.Color.green()
+    )
+    await interaction.response.send_message(embed=success_embed, ephemeral=True)
+
+
+@tree.command(name="unwatchgroup", description="Stop monitoring a Roblox group in this server.")
+@app_commands.describe(group_id="The ID of the Roblox group to stop monitoring.")
+async def unwatch_group_command(interaction: discord.Interaction, group_id: int):
+    """
+    Stop monitoring a Roblox group for this server.
+    """
+    guild_id = str(interaction.guild_id)
+    if not group_watches.is_watching(guild_id, group_id):
+        error_embed = discord.Embed(
+            title="Group Not Monitored",
+            description=f"Group ID `{group_id}` is not being monitored in this server.",
+            color=discord.Color.red()
+        )
+        await interaction.response.send_message(embed=error_embed, ephemeral=True)
+        return
+
+    await group_watches.remove(guild_id, group_id)
+    success_embed = discord.Embed(
+        title="Group Unmonitored",
+        description=f"Group ID `{group_id}` is no longer being monitored in this server.",
+        color=discord.Color.green()
+    )
+    await interaction.response.send_message(embed=success_embed, ephemeral=True)
+
+@tree.command(name="watchplace", description="Get an alert when a tracked user joins a Roblox game.")
+@app_commands.describe(place_id="The ID of the Roblox place to watch.")
+async def watch_place_command(interaction: discord.Interaction, place_id: int):
+    """
+    Watch a Roblox place (and the rest of its universe) for tracked users joining it.
+    """
+    guild_id = str(interaction.guild_id)
+    if place_id in server_place_ids.get(guild_id, {}):
+        error_embed = discord.Embed(
+            title="Place Already Watched",
+            description=f"Place ID `{place_id}` is already being watched in this server.",
+            color=discord.Color.orange()
+        )
+        await interaction.response.send_message(embed=error_embed, ephemeral=True)
+        return
+
+    try:
+        place = (await game_metadata.resolve_places([place_id], raise_errors=True)).get(place_id)
+    except RobloxAPIError:
+        # Already logged; a failed lookup (or no usable cookie) says nothing about whether the place exists
+        error_embed = discord.Embed(
+            title="Error",
+            description="Failed to look up the place. Please try again later.",
+            color=discord.Color.red()
+        )
+        await interaction.response.send_message(embed=error_embed, ephemeral=True)
+        return
+    if not place:
+        error_embed = discord.Embed(
+            title="Invalid Place ID",
+            description=f"No place found with the ID `{place_id}`.",
+            color=discord.Color.red()
+        )
+        await interaction.response.send_message(embed=error_embed, ephemeral=True)
+        return
+
+    server_place_ids.setdefault(guild_id, {})[place_id] = place["universe_id"]
+    await soul_store.add_watched_place(guild_id, place_id, place["universe_id"])
+    success_embed = discord.Embed(
+        title="Place Watched",
+        description=f"Tracked users joining **{place['name']}** (`{place_id}`) will be posted in the Game Alerts channel.",
+        color=discord.Color.green()
+    )
+    await interaction.response.send_message(embed=success_embed, ephemeral=True)
+
+
+@tree.command(name="unwatchplace", description="Stop game alerts for a Roblox place.")
+@app_commands.describe(place_id="The ID of the Roblox place to stop watching.")
+async def unwatch_place_command(interaction: discord.Interaction, place_id: int):
+    """
+    Stop watching a Roblox place for this server.
+    """
+    guild_id = str(interaction.guild_id)
+    if place_id not in server_place_ids.get(guild_id, {}):
+        error_embed = discord.Embed(
+            title="Place Not Watched",
+            description=f"Place ID `{place_id}` is not being watched in this server.",
+            color=discord.Color.red()
+        )
+        await interaction.response.send_message(embed=error_embed, ephemeral=True)
+        return
+
+    del server_place_ids[guild_id][place_id]
+    await soul_store.remove_watched_place(guild_id, place_id)
+    success_embed = discord.Embed(
+        title="Place Unwatched",
+        description=f"Place ID `{place_id}` is no longer being watched in this server.",
+        color=discord.Color.green()
+    )
+    await interaction.response.send_message(embed=success_embed, ephemeral=True)
+
 @tree.command(name="version", description="Show the current Roblox version.")
 async def version_command(interaction: discord.Interaction):
     """
     Fetch and display the current Roblox version.
     """
-    current_version = fetch_roblox_version()
+    current_version = await fetch_roblox_version()
     if current_version:
         embed = discord.Embed(
             title="Current Roblox Version",
@@ -1438,16 +4119,15 @@ async def version_command(interaction: discord.Interaction):
         await interaction.response.send_message(embed=error_embed, ephemeral=True)
 
 
-def fetch_roblox_version():
+async def fetch_roblox_version():
     """
     Fetch the current Roblox version from the API.
     """
     url = "https://setup.rbxcdn.com/version"
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.text.strip()  # The version is returned as plain text
-    except requests.exceptions.RequestException as e:
+        version = await roblox_request("GET", url, as_text=True)
+        return version.strip()  # The version is returned as plain text
+    except RobloxAPIError as e:
         log_error(e)
         print(f"Failed to fetch Roblox version: {e}")
         return None